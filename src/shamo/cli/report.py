@@ -1,11 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import json
 import os
+from pathlib import Path
+import re
+import shutil
 import subprocess as sub
+import sys
+import sysconfig
 import yaml
 
 import click
 import gmsh
 
+try:
+    from importlib.metadata import distributions
+except ImportError:  # Python < 3.8
+    distributions = None
 
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as Dumper
+
+# Matches the `key: value` pairs of the build information of gmsh and getdp
+_KV_RE = re.compile(r"([A-Za-z][\w -]*):\s*([^;\n]+)")
+
+
+def _parse_key(key):
+    return key.strip().replace(" ", "-").lower()
+
+
+@lru_cache(maxsize=1)
 def _get_os_info():
     info = os.uname()
     return {
@@ -16,13 +43,14 @@ def _get_os_info():
     }
 
 
+@lru_cache(maxsize=1)
 def _get_gmsh_info():
     gmsh.initialize()
-    info = gmsh.option.getString("General.BuildInfo")
-    gmsh.finalize()
-    lines = info.split("; ")
-    pairs = [l.split(": ") for l in lines]
-    info = {p[0].replace(" ", "-").lower(): p[1] for p in pairs}
+    try:
+        info = gmsh.option.getString("General.BuildInfo")
+    finally:
+        gmsh.finalize()
+    info = {_parse_key(m[1]): m[2].strip() for m in _KV_RE.finditer(info)}
     unwanted = ["license", "build-host", "web-site", "issue-tracker"]
     for u in unwanted:
         info.pop(u, None)
@@ -30,11 +58,15 @@ def _get_gmsh_info():
     return info
 
 
+@lru_cache(maxsize=1)
 def _get_getdp_info():
-    info = sub.run(["getdp", "-info"], capture_output=True).stderr.decode("utf-8")
-    lines = info.strip().split("\n")
-    pairs = [l.split(": ") for l in lines]
-    info = {p[0].strip().replace(" ", "-").lower(): p[1] for p in pairs}
+    info = {}
+    cmd = ["getdp", "-info"]
+    with sub.Popen(cmd, stdout=sub.DEVNULL, stderr=sub.PIPE, text=True) as p:
+        for line in p.stderr:
+            match = _KV_RE.match(line)
+            if match:
+                info[_parse_key(match[1])] = match[2].strip()
     unwanted = ["license", "build-host", "web-site", "issue-tracker"]
     for u in unwanted:
         info.pop(u, None)
@@ -44,20 +76,103 @@ def _get_getdp_info():
     return info
 
 
+@lru_cache(maxsize=1)
 def _get_pip_info():
-    info = sub.run(["pip", "list"], capture_output=True).stdout.decode("utf-8")
-    lines = info.strip().split("\n")[2:]
-    pairs = [l.split() for l in lines]
-    return {p[0]: p[1] for p in pairs}
+    info = {}
+    if distributions is not None:
+        for d in distributions():
+            name = d.metadata["Name"]
+            if name:
+                info[name] = d.version
+        return info
+    cmd = ["pip", "list"]
+    with sub.Popen(cmd, stdout=sub.PIPE, stderr=sub.DEVNULL, text=True) as p:
+        # Skip the header of the table
+        next(p.stdout, None)
+        next(p.stdout, None)
+        for line in p.stdout:
+            fields = line.split(None, 2)
+            if len(fields) >= 2:
+                info[fields[0]] = fields[1]
+    return info
+
+
+def _get_cache_path():
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_dir) / "shamo" / "report.json"
+
+
+def _get_env_key():
+    # The report only changes if one of these files or directories is modified
+    paths = [
+        shutil.which("getdp"),
+        gmsh.__file__,
+        sys.executable,
+        sysconfig.get_path("purelib"),
+        sysconfig.get_path("platlib"),
+    ]
+    stamps = [
+        (p, os.stat(p).st_mtime_ns if p and os.path.exists(p) else None) for p in paths
+    ]
+    fingerprint = repr((tuple(os.uname()), stamps)).encode()
+    return hashlib.blake2b(fingerprint, digest_size=8).hexdigest()
+
+
+def _load_cached_report(cache_path, key):
+    try:
+        with open(cache_path, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("key") != key:
+        return None
+    return cache.get("report", None)
+
+
+def _save_cached_report(cache_path, key, report):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"key": key, "report": report}, f)
+    except OSError:
+        pass
 
 
 @click.command()
-def main():
-    _get_os_info()
-    report = {
-        "os": _get_os_info(),
-        "gmsh": _get_gmsh_info(),
-        "getdp": _get_getdp_info(),
-        "packages": _get_pip_info(),
-    }
-    click.echo(yaml.dump(report))
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse the cached report if the environment did not change.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+def main(use_cache, as_json):
+    report = None
+    if use_cache:
+        cache_path = _get_cache_path()
+        key = _get_env_key()
+        report = _load_cached_report(cache_path, key)
+        if report is not None:
+            click.echo(f"Report loaded from '{cache_path}'.", err=True)
+    if report is None:
+        # The probes are independent and mostly wait on I/O or subprocesses. gmsh
+        # installs a signal handler when initialized so it stays in the main thread.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "os": executor.submit(_get_os_info),
+                "getdp": executor.submit(_get_getdp_info),
+                "packages": executor.submit(_get_pip_info),
+            }
+            gmsh_info = _get_gmsh_info()
+            report = {
+                "os": futures["os"].result(),
+                "gmsh": gmsh_info,
+                "getdp": futures["getdp"].result(),
+                "packages": futures["packages"].result(),
+            }
+        if use_cache:
+            _save_cached_report(cache_path, key, report)
+    if as_json:
+        click.echo(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        click.echo(yaml.dump(report, Dumper=Dumper))
@@ -1,27 +1,59 @@
 """Implement `DistABC` class."""
-from abc import ABC, abstractproperty
+from abc import ABC, abstractmethod, abstractproperty
+from functools import lru_cache
 
-import chaospy as chaos
+import numpy as np
 
 
-class DistABC(dict, ABC):
+class DistABC(ABC):
     """A base class for any probability distribution.
 
+    Distributions are immutable and their parameters are stored as attributes named
+    after the parameters of their constructor.
+
     Parameters
     ----------
-    dist_type : str
-        The type of the distribution.
+    **kwargs
+        The parameters of the distribution.
     """
 
+    __slots__ = ("_dist", "_uniform_dist", "_expect", "_salib_bounds", "__weakref__")
+
     TYPE_CONSTANT = "constant"
     TYPE_NORMAL = "normal"
     TYPE_TRUNC_NORMAL = "trunc_normal"
     TYPE_UNIFORM = "uniform"
 
-    def __init__(self, dist_type, **kwargs):
-        super().__init__({"dist_type": dist_type})
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_dist", None)
+        object.__setattr__(self, "_uniform_dist", None)
+        object.__setattr__(self, "_expect", None)
+        object.__setattr__(self, "_salib_bounds", ())
 
-    @property
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' objects are immutable.")
+
+    def __eq__(self, other):
+        if not isinstance(other, DistABC):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.dist_type, *(getattr(self, n) for n in self.__slots__)))
+
+    def __repr__(self):
+        params = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({params})"
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, n) for n in self.__slots__)
+
+    @abstractproperty
     def dist_type(self):
         """Return the type of the distribution.
 
@@ -30,9 +62,39 @@ class DistABC(dict, ABC):
         str
             The type of the distribution.
         """
-        return self["dist_type"]
 
-    @abstractproperty
+    def to_dict(self):
+        """Return the dict representation of the distribution.
+
+        Returns
+        -------
+        dict [str, Any]
+            The dict representation of the distribution.
+        """
+        # The slots of a subclass are the parameters of its constructor.
+        params = {n: getattr(self, n) for n in self.__slots__}
+        return {"dist_type": self.dist_type, **params}
+
+    @staticmethod
+    def from_dict(data):
+        """Return a distribution from its dict representation.
+
+        Parameters
+        ----------
+        data : dict [str, Any] or DistABC
+            The dict representation of the distribution. If `data` already is a
+            distribution, it is returned as is.
+
+        Returns
+        -------
+        DistABC
+            The distribution.
+        """
+        if isinstance(data, DistABC):
+            return data
+        return DistABC.load(**data)
+
+    @property
     def dist(self):
         """Return the actual distribution.
 
@@ -40,12 +102,46 @@ class DistABC(dict, ABC):
         -------
         chaospy.Distribution
             The actual distribution.
+
+        Notes
+        -----
+        The distribution is only built once and then cached.
         """
+        if self._dist is None:
+            object.__setattr__(self, "_dist", self._gen_dist())
+        return self._dist
 
-    @abstractproperty
+    @property
     def uniform_dist(self):
         """Return a uniform distribution used for sampling.
 
+        Returns
+        -------
+        chaospy.Uniform
+            The uniform distribution.
+
+        Notes
+        -----
+        The distribution is only built once and then cached.
+        """
+        if self._uniform_dist is None:
+            object.__setattr__(self, "_uniform_dist", self._gen_uniform_dist())
+        return self._uniform_dist
+
+    @abstractmethod
+    def _gen_dist(self):
+        """Build the actual distribution.
+
+        Returns
+        -------
+        chaospy.Distribution
+            The actual distribution.
+        """
+
+    @abstractmethod
+    def _gen_uniform_dist(self):
+        """Build a uniform distribution used for sampling.
+
         Returns
         -------
         chaospy.Uniform
@@ -62,15 +158,16 @@ class DistABC(dict, ABC):
             The name of the distribution in SALib.
         """
 
-    @abstractproperty
+    @property
     def salib_bounds(self):
         """Return the bounds of the distribution in SALib.
 
         Returns
         -------
-        list [float]
+        tuple [float]
             The bounds of the distribution in SALib.
         """
+        return self._salib_bounds
 
     @property
     def expect(self):
@@ -81,7 +178,88 @@ class DistABC(dict, ABC):
         float
             The expected value of the distribution.
         """
-        return float(chaos.E(self.dist))
+        if self._expect is None:
+            import chaospy as chaos
+
+            object.__setattr__(self, "_expect", float(chaos.E(self.dist)))
+        return self._expect
+
+    @staticmethod
+    def expect_many(dists):
+        """Return the expected values of multiple distributions.
+
+        Parameters
+        ----------
+        dists : Iterable [DistABC]
+            The distributions.
+
+        Returns
+        -------
+        numpy.ndarray
+            The expected values of the distributions.
+
+        Notes
+        -----
+        Distributions providing their own expected value, like constants or those
+        with a closed form, use it. The expected values of all the others are
+        computed at once from their joint distribution.
+        """
+        dists = list(dists)
+        # Only the distributions relying on the generic `expect` need chaospy.
+        generic = [type(d).expect is DistABC.expect for d in dists]
+        expects = np.array(
+            [np.nan if g else d.expect for d, g in zip(dists, generic)], dtype=float
+        )
+        varying = [i for i, g in enumerate(generic) if g]
+        if varying:
+            import chaospy as chaos
+
+            joint = chaos.J(*[dists[i].dist for i in varying])
+            expects[varying] = np.atleast_1d(chaos.E(joint))
+        return expects
+
+    @staticmethod
+    def sample_many(dists, n, rng=None):
+        """Draw samples from multiple distributions at once.
+
+        Parameters
+        ----------
+        dists : Iterable [DistABC]
+            The distributions.
+        n : int
+            The number of samples to draw from each distribution.
+        rng : numpy.random.Generator, optional
+            The random generator to use. If not set, a new one is created.
+
+        Returns
+        -------
+        numpy.ndarray
+            The samples with shape ``(len(dists), n)``. The rows of constant
+            distributions are filled with their value.
+
+        Notes
+        -----
+        The non-constant distributions are sampled at once by applying the inverse
+        cumulative distribution function of their joint distribution to uniform
+        samples drawn from `rng`.
+        """
+        dists = list(dists)
+        if rng is None:
+            rng = np.random.default_rng()
+        samples = np.empty((len(dists), n))
+        varying = []
+        for i, d in enumerate(dists):
+            if d.dist is None:
+                samples[i, :] = d.expect
+            else:
+                varying.append(i)
+        if varying:
+            import chaospy as chaos
+
+            joint = chaos.J(*[dists[i].dist for i in varying])
+            u = rng.random((len(varying), n))
+            samples[varying, :] = np.reshape(joint.inv(u), (len(varying), n))
+        return samples
 
     @staticmethod
     def load(dist_type, **kwargs):
@@ -91,15 +269,36 @@ class DistABC(dict, ABC):
         -------
         DistABC
             The loaded distribution.
+
+        Notes
+        -----
+        Loaded distributions are memoized so identical distributions share the same
+        instance.
         """
-        from .constant import DistConstant
-        from .normal import DistNormal, DistTruncNormal
-        from .uniform import DistUniform
-
-        dist_types = {
-            DistABC.TYPE_CONSTANT: DistConstant,
-            DistABC.TYPE_NORMAL: DistNormal,
-            DistABC.TYPE_TRUNC_NORMAL: DistTruncNormal,
-            DistABC.TYPE_UNIFORM: DistUniform,
-        }
-        return dist_types[dist_type](**kwargs)
+        key = tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return _get_dist_types()[dist_type](**kwargs)
+        return _load_cached(dist_type, key)
+
+
+@lru_cache(maxsize=None)
+def _get_dist_types():
+    """Return the classes of the distributions indexed by their type."""
+    from .constant import DistConstant
+    from .normal import DistNormal, DistTruncNormal
+    from .uniform import DistUniform
+
+    return {
+        DistABC.TYPE_CONSTANT: DistConstant,
+        DistABC.TYPE_NORMAL: DistNormal,
+        DistABC.TYPE_TRUNC_NORMAL: DistTruncNormal,
+        DistABC.TYPE_UNIFORM: DistUniform,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _load_cached(dist_type, key):
+    """Load a distribution from its hashable representation."""
+    return _get_dist_types()[dist_type](**{k: v for k, _, v in key})
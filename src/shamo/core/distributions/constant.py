@@ -1,4 +1,6 @@
 """Implement `DistConstant` class."""
+from weakref import WeakValueDictionary
+
 from .abc import DistABC
 
 
@@ -14,20 +16,29 @@ class DistConstant(DistABC):
         The constant value.
     """
 
-    def __init__(self, val):
-        super().__init__(self.TYPE_CONSTANT)
-        self.update({"val": val})
+    __slots__ = ("val",)
 
-    @property
-    def val(self):
-        """Return the constant value.
+    dist_type = DistABC.TYPE_CONSTANT
+    salib_name = ""
 
-        Returns
-        -------
-        float
-            The constant value.
-        """
-        return self["val"]
+    _pool = WeakValueDictionary()
+
+    def __new__(cls, val):
+        # Identical constants share the same instance as long as it is alive.
+        key = (cls, type(val), val)
+        try:
+            obj = cls._pool.get(key)
+        except TypeError:
+            return super().__new__(cls)
+        if obj is None:
+            obj = super().__new__(cls)
+            cls._pool[key] = obj
+        return obj
+
+    def __init__(self, val):
+        if hasattr(self, "val"):
+            return
+        super().__init__(val=val)
 
     @property
     def expect(self):
@@ -40,34 +51,10 @@ class DistConstant(DistABC):
         """
         return self.val
 
-    @property
-    def dist(self):
+    def _gen_dist(self):
         """Return ``None``."""
         return None
 
-    @property
-    def uniform_dist(self):
+    def _gen_uniform_dist(self):
         """Return ``None``."""
         return None
-
-    @property
-    def salib_name(self):
-        """Return the name of the distribution in SALib.
-
-        Returns
-        -------
-        str
-            The name of the distribution in SALib.
-        """
-        return ""
-
-    @property
-    def salib_bounds(self):
-        """Return the bounds of the distribution in SALib.
-
-        Returns
-        -------
-        list [float]
-            The bounds of the distribution in SALib.
-        """
-        return []
@@ -1,7 +1,7 @@
 """Implement `DistNormal` and `DistTruncNormal` classes."""
-from .abc import DistABC
+import math
 
-import chaospy as chaos
+from .abc import DistABC
 
 
 class DistNormal(DistABC):
@@ -15,74 +15,52 @@ class DistNormal(DistABC):
         The standard deviation of the distribution.
     """
 
-    def __init__(self, mu, sigma):
-        super().__init__(self.TYPE_NORMAL)
-        self.update({"mu": mu, "sigma": sigma})
+    __slots__ = ("mu", "sigma")
 
-    @property
-    def mu(self):
-        """Return the mean of the distribution.
+    dist_type = DistABC.TYPE_NORMAL
+    salib_name = "norm"
 
-        mu : float
-            The mean of the distribution.
-        """
-        return self["mu"]
+    def __init__(self, mu, sigma):
+        super().__init__(mu=mu, sigma=sigma)
+        object.__setattr__(self, "_salib_bounds", (self.mu, self.sigma))
 
     @property
-    def sigma(self):
-        """Return the standard deviation of the distribution.
+    def expect(self):
+        """Return the expected value of the distribution.
 
-        sigma : float
-            The standard deviation of the distribution.
+        Returns
+        -------
+        float
+            The expected value of the distribution.
         """
-        return self["sigma"]
+        return float(self.mu)
 
-    @property
-    def dist(self):
-        """Return the actual distribution.
+    def _gen_dist(self):
+        """Build the actual distribution.
 
         Returns
         -------
         chaospy.Normal
             The actual distribution.
         """
+        import chaospy as chaos
+
         return chaos.Normal(mu=self.mu, sigma=self.sigma)
 
-    @property
-    def uniform_dist(self):
-        """Return a uniform distribution used for sampling.
+    def _gen_uniform_dist(self):
+        """Build a uniform distribution used for sampling.
 
         Returns
         -------
         chaospy.Uniform
             The uniform distribution.
         """
+        import chaospy as chaos
+
         return chaos.Uniform(
             lower=self.mu - 3 * self.sigma, upper=self.mu + 3 * self.sigma
         )
 
-    @property
-    def salib_name(self):
-        """Return the name of the distribution in SALib.
-
-        Returns
-        -------
-        str
-            The name of the distribution in SALib.
-        """
-        return "norm"
-
-    @property
-    def salib_bounds(self):
-        """Return the bounds of the distribution in SALib.
-
-        Returns
-        -------
-        list [float]
-            The bounds of the distribution in SALib.
-        """
-        return [self.mu, self.sigma]
-
 
 class DistTruncNormal(DistABC):
     """A truncated normal distribution.
@@ -99,92 +77,72 @@ class DistTruncNormal(DistABC):
         The upper bound of the distribution.
     """
 
-    def __init__(self, mu, sigma, lower, upper):
-        super().__init__(self.TYPE_TRUNC_NORMAL)
-        self.update({"mu": mu, "sigma": sigma, "lower": lower, "upper": upper})
+    __slots__ = ("mu", "sigma", "lower", "upper")
 
-    @property
-    def mu(self):
-        """Return the mean of the distribution.
+    dist_type = DistABC.TYPE_TRUNC_NORMAL
+    salib_name = "truncnorm"
 
-        mu : float
-            The mean of the distribution.
-        """
-        return self["mu"]
-
-    @property
-    def sigma(self):
-        """Return the standard deviation of the distribution.
-
-        sigma : float
-            The standard deviation of the distribution.
-        """
-        return self["sigma"]
+    def __init__(self, mu, sigma, lower, upper):
+        super().__init__(mu=mu, sigma=sigma, lower=lower, upper=upper)
+        object.__setattr__(
+            self, "_salib_bounds", (self.lower, self.upper, self.mu, self.sigma)
+        )
 
     @property
-    def lower(self):
-        """Return the lower bound of the distribution.
+    def expect(self):
+        """Return the expected value of the distribution.
 
         Returns
         -------
         float
-            The lower bound of the distribution.
-        """
-        return self["lower"]
-
-    @property
-    def upper(self):
-        """Return the upper bound of the distribution.
+            The expected value of the distribution.
 
-        Returns
-        -------
-        float
-            The upper bound of the distribution.
+        Notes
+        -----
+        The expected value is computed from its closed form.
         """
-        return self["upper"]
-
-    @property
-    def dist(self):
-        """Return the actual distribution.
+        if self._expect is None:
+            alpha = (self.lower - self.mu) / self.sigma
+            beta = (self.upper - self.mu) / self.sigma
+            pdf_diff = _normal_pdf(alpha) - _normal_pdf(beta)
+            cdf_diff = _normal_cdf(beta) - _normal_cdf(alpha)
+            object.__setattr__(
+                self, "_expect", float(self.mu + self.sigma * pdf_diff / cdf_diff)
+            )
+        return self._expect
+
+    def _gen_dist(self):
+        """Build the actual distribution.
 
         Returns
         -------
         chaospy.TruncNormal
             The actual distribution.
         """
-        return chaos.Normal(
-            mu=self.mu, sigma=self.sigma, lower=self.lower, upper=self.upper
+        import chaospy as chaos
+
+        return chaos.TruncNormal(
+            lower=self.lower, upper=self.upper, mu=self.mu, sigma=self.sigma
         )
 
-    @property
-    def uniform_dist(self):
-        """Return a uniform distribution used for sampling.
+    def _gen_uniform_dist(self):
+        """Build a uniform distribution used for sampling.
 
         Returns
         -------
         chaospy.Uniform
             The uniform distribution.
         """
+        import chaospy as chaos
+
         return chaos.Uniform(lower=self.lower, upper=self.upper)
 
-    @property
-    def salib_name(self):
-        """Return the name of the distribution in SALib.
 
-        Returns
-        -------
-        str
-            The name of the distribution in SALib.
-        """
-        return "truncnorm"
+def _normal_pdf(x):
+    """Return the probability density function of the standard normal."""
+    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
 
-    @property
-    def salib_bounds(self):
-        """Return the bounds of the distribution in SALib.
 
-        Returns
-        -------
-        list [float]
-            The bounds of the distribution in SALib.
-        """
-        return [self.lower, self.upper, self.mu, self.sigma]
+def _normal_cdf(x):
+    """Return the cumulative distribution function of the standard normal."""
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
@@ -1,8 +1,6 @@
 """Implement `DistUniform` class."""
 from .abc import DistABC
 
-import chaospy as chaos
-
 
 class DistUniform(DistABC):
     """A uniform distribution.
@@ -15,46 +13,40 @@ class DistUniform(DistABC):
         The upper bound of the distribution.
     """
 
-    def __init__(self, lower, upper):
-        super().__init__(self.TYPE_UNIFORM)
-        self.update({"lower": lower, "upper": upper})
+    __slots__ = ("lower", "upper")
 
-    @property
-    def lower(self):
-        """Return the lower bound of the distribution.
+    dist_type = DistABC.TYPE_UNIFORM
+    salib_name = "unif"
 
-        Returns
-        -------
-        float
-            The lower bound of the distribution.
-        """
-        return self["lower"]
+    def __init__(self, lower, upper):
+        super().__init__(lower=lower, upper=upper)
+        object.__setattr__(self, "_salib_bounds", (self.lower, self.upper))
 
     @property
-    def upper(self):
-        """Return the upper bound of the distribution.
+    def expect(self):
+        """Return the expected value of the distribution.
 
         Returns
         -------
         float
-            The upper bound of the distribution.
+            The expected value of the distribution.
         """
-        return self["upper"]
+        return 0.5 * (self.lower + self.upper)
 
-    @property
-    def dist(self):
-        """Return the actual distribution.
+    def _gen_dist(self):
+        """Build the actual distribution.
 
         Returns
         -------
         chaospy.Uniform
             The actual distribution.
         """
+        import chaospy as chaos
+
         return chaos.Uniform(self.lower, self.upper)
 
-    @property
-    def uniform_dist(self):
-        """Return a uniform distribution used for sampling.
+    def _gen_uniform_dist(self):
+        """Build a uniform distribution used for sampling.
 
         Returns
         -------
@@ -62,25 +54,3 @@ class DistUniform(DistABC):
             The uniform distribution.
         """
         return self.dist
-
-    @property
-    def salib_name(self):
-        """Return the name of the distribution in SALib.
-
-        Returns
-        -------
-        str
-            The name of the distribution in SALib.
-        """
-        return "unif"
-
-    @property
-    def salib_bounds(self):
-        """Return the bounds of the distribution in SALib.
-
-        Returns
-        -------
-        list [float]
-            The bounds of the distribution in SALib.
-        """
-        return [self.lower, self.upper]
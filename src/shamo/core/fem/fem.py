@@ -1,7 +1,10 @@
 """Implement the `FEM` class."""
 import logging
+from collections import deque
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import partialmethod
+from itertools import chain
 import os
 from pathlib import Path
 from pprint import pformat
@@ -10,9 +13,10 @@ from tempfile import TemporaryDirectory
 import meshio
 import nibabel as nib
 import numpy as np
-from nilearn.image import crop_img
-from scipy.interpolate import RegularGridInterpolator
-from scipy.spatial.distance import cdist
+from scipy.ndimage import find_objects, map_coordinates
+from scipy.sparse import bmat, csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
 import gmsh
 import pygalmesh as cgal
@@ -40,14 +44,17 @@ class FEM(ObjDir):
         self.update(
             {
                 "tissues": {
-                    t: Tissue(**d) for t, d in kwargs.get("tissues", {}).items()
+                    t: Tissue.from_dict(d) for t, d in kwargs.get("tissues", {}).items()
                 },
                 "mesh_params": kwargs.get("mesh_params", {}),
                 "sensors": {
-                    s: SensorABC.load(**d) for s, d in kwargs.get("sensors", {}).items()
+                    s: SensorABC.from_dict(d)
+                    for s, d in kwargs.get("sensors", {}).items()
                 },
             }
         )
+        self._nii_cache = None
+        self._mesh_cache = None
         logger.info(f"Model '{name}' initialized in '{parent_path}'  directory.")
 
     @property
@@ -70,8 +77,7 @@ class FEM(ObjDir):
         numpy.ndarray
             The affine matrix of the NIFTI file.
         """
-        img = nib.load(self.nii_path)
-        return img.affine
+        return self._get_nii().affine
 
     @property
     def shape(self):
@@ -82,8 +88,17 @@ class FEM(ObjDir):
         numpy.ndarray
             The shape of the NIFTI file.
         """
-        img = nib.load(self.nii_path)
-        return img.shape
+        return self._get_nii().shape
+
+    def _get_nii(self):
+        """Return the NIFTI image without loading its data.
+
+        The image is only reloaded if the NIFTI file was modified.
+        """
+        mtime = self.nii_path.stat().st_mtime_ns
+        if self._nii_cache is None or self._nii_cache[0] != mtime:
+            self._nii_cache = (mtime, nib.load(str(self.nii_path)))
+        return self._nii_cache[1]
 
     @property
     def mesh_path(self):
@@ -96,6 +111,16 @@ class FEM(ObjDir):
         """
         return self.path / f"{self.name}.msh"
 
+    def _get_mesh_cache(self):
+        """Return the cache of the data read from the mesh.
+
+        The cache is emptied if the MSH file was modified.
+        """
+        mtime = self.mesh_path.stat().st_mtime_ns
+        if self._mesh_cache is None or self._mesh_cache[0] != mtime:
+            self._mesh_cache = (mtime, {})
+        return self._mesh_cache[1]
+
     @property
     def tissues(self):
         """Return the tissues of the model.
@@ -187,38 +212,40 @@ class FEM(ObjDir):
         """
         if not isinstance(labels, np.ndarray):
             raise TypeError("Argument 'labels' expects type numpy.ndarray.")
-        labels = labels.astype(np.uint8)
+        if labels.dtype != np.uint8:
+            labels = labels.astype(np.uint8)
         if labels.ndim != 3:
             raise ValueError("Argument 'labels' must be a 3D array.")
         if not isinstance(affine, np.ndarray):
             raise TypeError("Argument 'affine' expects type numpy.ndarray.")
         if affine.shape not in ((3, 4), (4, 4)):
             raise ValueError("Argument 'affine' expects shape (3,4) or (4,4).")
-        affine = np.vstack((affine[:3, :], np.array([0, 0, 0, 1])))
         # Convert [mm] to [m]
-        affine = np.diag([1e-3] * 3 + [1]) @ affine
+        affine = np.vstack((1e-3 * affine[:3, :], [0, 0, 0, 1]))
         tissues = list(tissues)
-        for t in tissues:
-            if not isinstance(t, str):
-                raise TypeError("Argument 'tissues' expects an iterable of str.")
-        if len(tissues) != np.max(labels):
+        if not all(isinstance(t, str) for t in tissues):
+            raise TypeError("Argument 'tissues' expects an iterable of str.")
+
+        labels, affine = _crop_labels(labels, affine)
+        # Cropping only removes background so the labels are checked on the smaller
+        # volume
+        if len(tissues) != labels.max(initial=0):
             raise ValueError(
                 (
                     "Argument 'tissues' must contain as many names "
                     "as there are unique labels in 'labels'."
                 )
             )
-
-        img = nib.Nifti1Image(labels, affine)
-        cropped_img = crop_img(img)
-        cropped_img.to_filename(self.nii_path)
-        labels = cropped_img.get_fdata().astype(np.uint16)
-        affine = cropped_img.affine
+        nib.Nifti1Image(labels, affine).to_filename(self.nii_path)
 
         with TemporaryDirectory(dir=os.environ.get("SHAMO_TMP_DIR", None)) as d:
             self._gen_init_mesh(labels, np.eye(4), d, **kwargs)
-            self._apply_transform(affine, d)
-            self._add_tissues(tissues, d)
+            # Keep the same session to avoid writing and reading an intermediate mesh
+            with gmsh_open(Path(d) / "init_mesh.msh", logger) as gmsh:
+                self._apply_transform(gmsh, affine)
+                self._add_tissues_groups(gmsh, tissues)
+                gmsh.option.setNumber("Mesh.Binary", 1)
+                gmsh.write(str(self.mesh_path))
         self.save()
         logger.info("Mesh generated.")
 
@@ -271,7 +298,10 @@ class FEM(ObjDir):
 
         img = nib.load(str(nii_path))
         return self.mesh_from_array(
-            img.get_fdata().astype(np.uint8), img.affine, tissues, **kwargs
+            np.asanyarray(img.dataobj, dtype=np.uint8),
+            img.affine,
+            tissues,
+            **kwargs,
         )
 
     def mesh_from_masks(self, masks, affine, **kwargs):
@@ -330,24 +360,19 @@ class FEM(ObjDir):
                 raise TypeError(
                     "Argument 'masks' expects a mapping from str to numpy.ndarray."
                 )
-        shape = None
-        for m in masks.values():
-            if not isinstance(m, np.ndarray):
-                raise TypeError(
-                    "Argument 'masks' expects a mapping from str to numpy.ndarray."
-                )
-            if shape is not None and m.shape != shape:
-                raise ValueError(
-                    "Values in argument 'masks' must all have the same shape."
-                )
-            shape = m.shape
+        if not all(isinstance(m, np.ndarray) for m in masks.values()):
+            raise TypeError(
+                "Argument 'masks' expects a mapping from str to numpy.ndarray."
+            )
+        if len({m.shape for m in masks.values()}) > 1:
+            raise ValueError("Values in argument 'masks' must all have the same shape.")
 
-        labels = np.zeros(list(masks.values())[0].shape)
-        tissues = []
-        for l, (t, m) in enumerate(masks.items()):
-            labels[m.astype(bool)] = l + 1
-            tissues.append(t)
-        return self.mesh_from_array(labels, affine, tissues, **kwargs)
+        labels = np.zeros(next(iter(masks.values())).shape, dtype=np.uint8)
+        for l, m in enumerate(masks.values()):
+            # Boolean masks are used as is to avoid a temporary copy of the volume
+            mask = m if m.dtype == bool else m.astype(bool)
+            np.putmask(labels, mask, l + 1)
+        return self.mesh_from_array(labels, affine, list(masks.keys()), **kwargs)
 
     def mesh_from_niis(self, niis, **kwargs):
         """Generate a MSH file from multiple binary masks.
@@ -405,55 +430,68 @@ class FEM(ObjDir):
         for t, p in niis.items():
             niis[t] = Path(p)
 
-        imgs = {t: nib.load(str(p)) for t, p in niis.items()}
-        return self.mesh_from_masks(
-            {t: i.get_fdata() for t, i in imgs.items()},
-            list(imgs.values())[0].affine,
-            **kwargs,
-        )
+        # Decompressing the masks releases the GIL so they can be loaded concurrently
+        n_workers = min(len(niis), (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max(n_workers, 1)) as executor:
+            loaded = dict(zip(niis.keys(), executor.map(_load_mask, niis.values())))
+        masks = {t: m for t, (m, _) in loaded.items()}
+        return self.mesh_from_masks(masks, next(iter(loaded.values()))[1], **kwargs)
 
     def _gen_init_mesh(self, labels, affine, tmp_dir, **kwargs):
         """Generate the initial mesh usign CGAL."""
         init_mesh = cgal.generate_from_array(
             labels, nib.affines.voxel_sizes(affine), **kwargs
         )
-        meshio.write(str(Path(tmp_dir) / "init_mesh.mesh"), init_mesh)
+        # Use the MEDIT references as elementary entities like the MEDIT reader of gmsh
+        refs = init_mesh.cell_data.pop("medit:ref")
+        init_mesh.cell_data["gmsh:geometrical"] = refs
+        init_mesh.cell_data["gmsh:physical"] = [np.zeros_like(r) for r in refs]
+        meshio.write(
+            str(Path(tmp_dir) / "init_mesh.msh"),
+            init_mesh,
+            file_format="gmsh22",
+            binary=True,
+        )
         self["mesh_params"] = kwargs
         logger.info("Initial mesh generated.")
 
-    def _apply_transform(self, affine, tmp_dir):
-        """Apply the affine transform to the mesh."""
-        with gmsh_open(Path(tmp_dir) / "init_mesh.mesh", logger) as gmsh:
-            gmsh.plugin.run("NewView")
-            axes = ["x", "y", "z"]
-            for r in range(3):
-                for c in range(3):
-                    gmsh.plugin.setNumber(
-                        "Transform", "A{}{}".format(r + 1, c + 1), affine[r, c]
-                    )
-                gmsh.plugin.setNumber("Transform", "T{}".format(axes[r]), affine[r, -1])
-            gmsh.plugin.run("Transform")
-            # gmsh.model.mesh.reclassifyNodes()
-            gmsh.option.setNumber("Mesh.Binary", 1)
-            gmsh.write(str(Path(tmp_dir) / "init_mesh.msh"))
+    def _apply_transform(self, gmsh, affine):
+        """Apply the affine transform to the mesh opened in `gmsh`."""
+        gmsh.plugin.run("NewView")
+        axes = ["x", "y", "z"]
+        for r in range(3):
+            for c in range(3):
+                gmsh.plugin.setNumber(
+                    "Transform", "A{}{}".format(r + 1, c + 1), affine[r, c]
+                )
+            gmsh.plugin.setNumber("Transform", "T{}".format(axes[r]), affine[r, -1])
+        gmsh.plugin.run("Transform")
+        # gmsh.model.mesh.reclassifyNodes()
         logger.info("Affine transformation applied.")
 
     def _add_tissues(self, tissues, tmp_dir):
         """Add the tissues as physical groups."""
         with gmsh_open(Path(tmp_dir) / "init_mesh.msh", logger) as gmsh:
-            for l, t in enumerate(tissues):
-                entity = l + 1
-                surf_group = gmsh.model.addPhysicalGroup(2, [entity])
-                gmsh.model.setPhysicalName(2, surf_group, t)
-                vol_group = gmsh.model.addPhysicalGroup(3, [entity])
-                gmsh.model.setPhysicalName(3, vol_group, t)
-                self["tissues"][t] = Tissue(
-                    Group(2, [entity], surf_group), Group(3, [entity], vol_group)
-                )
-                logger.info(f"Tissue '{t}' added.")
+            self._add_tissues_groups(gmsh, tissues)
             gmsh.option.setNumber("Mesh.Binary", 1)
             gmsh.write(str(self.mesh_path))
 
+    def _add_tissues_groups(self, gmsh, tissues):
+        """Add the tissues as physical groups to the mesh opened in `gmsh`."""
+        # Assign the tags gmsh would pick so it does not look for a free one each time,
+        # they must be unique across dimensions since GetDP selects regions by tag
+        base = self._get_max_group()
+        for l, t in enumerate(tissues):
+            entity = l + 1
+            surf_group = gmsh.model.addPhysicalGroup(2, [entity], base + 2 * l + 1)
+            gmsh.model.setPhysicalName(2, surf_group, t)
+            vol_group = gmsh.model.addPhysicalGroup(3, [entity], base + 2 * l + 2)
+            gmsh.model.setPhysicalName(3, vol_group, t)
+            self["tissues"][t] = Tissue(
+                Group(2, [entity], surf_group), Group(3, [entity], vol_group)
+            )
+            logger.info(f"Tissue '{t}' added.")
+
     def mesh_from_fem(self, fem_path, merges):
         """Generate a mesh from an existing FEM by merging tissues.
 
@@ -483,19 +521,17 @@ class FEM(ObjDir):
     def _merge_tissues(self, fem, merge_from, merge_to):
         """Merge multiple tissues into one."""
         # Edit mesh
-        surf_entities = []
-        vol_entities = []
-        for t in merge_from:
-            surf_entities.extend(fem.tissues[t].surf.entities)
-            vol_entities.extend(fem.tissues[t].surf.entities)
-        max_tag = np.max([t for _, t in gmsh.model.getPhysicalGroups(-1)])
+        merged = [fem.tissues[t] for t in merge_from]
+        surf_entities = list(chain.from_iterable(t.surf.entities for t in merged))
+        vol_entities = list(chain.from_iterable(t.vol.entities for t in merged))
+        max_tag = self._get_max_group()
         surf_group = gmsh.model.addPhysicalGroup(2, surf_entities, max_tag + 1)
         vol_group = gmsh.model.addPhysicalGroup(3, vol_entities, max_tag + 2)
-        for t in merge_from:
-            gmsh.model.removePhysicalGroups(
-                [(2, fem.tissues[t].surf.group), (3, fem.tissues[t].vol.group)]
-            )
-            for f in fem.tissues[t].fields.values():
+        gmsh.model.removePhysicalGroups(
+            [g for t in merged for g in ((2, t.surf.group), (3, t.vol.group))]
+        )
+        for t, tissue in zip(merge_from, merged):
+            for f in tissue.fields.values():
                 gmsh.view.remove(f.view)
             fem.tissues.pop(t, None)
         gmsh.model.setPhysicalName(2, surf_group, merge_to)
@@ -507,7 +543,7 @@ class FEM(ObjDir):
         # Edit model sensors
         for s in fem.sensors.values():
             if s.tissue in merge_from:
-                s["tissue"] = merge_to
+                s.tissue = merge_to
         logger.info(f"Merged {len(merge_from)} tissues into {merge_to}.")
 
     def mesh_from_surfaces(self, tissues, structure, lc=0.0):
@@ -544,7 +580,8 @@ class FEM(ObjDir):
         """Generate the initial mesh from a series of surfaces."""
         indices = {}
         oredered_tissues = []
-        with gmsh_open(str(Path(tmp_dir) / "init_mesh.msh"), logger) as gmsh:
+        init_mesh_path = str(Path(tmp_dir) / "init_mesh.msh")
+        with gmsh_open(init_mesh_path, logger) as gmsh:
             # Add the surfaces
             for i, (t, p) in enumerate(tissues.items()):
                 gmsh.merge(str(Path(p)))
@@ -564,7 +601,7 @@ class FEM(ObjDir):
                     )
                     gmsh.option.setNumber("Mesh.CharacteristicLengthMax", lc)
                 gmsh.model.mesh.generate(3)
-                gmsh.write(str(Path(tmp_dir) / "init_mesh.msh"))
+                gmsh.write(init_mesh_path)
                 logger.info("Initial mesh generated.")
                 return oredered_tissues
             # Generate a coarse mesh
@@ -597,16 +634,18 @@ class FEM(ObjDir):
             gmsh.model.mesh.removeDuplicateNodes()
             gmsh.option.setNumber("Mesh.Binary", 1)
             gmsh.model.mesh.reclassifyNodes()
-            gmsh.write(str(Path(tmp_dir) / "init_mesh.msh"))
+            gmsh.write(init_mesh_path)
         logger.info("Initial mesh generated.")
         return oredered_tissues
 
     def _get_surf_loops(self, structure):
         """Extract surface loops booleans from tree structure."""
         vols = {}
-        queue = []
+        # Work on queues so the structure given by the user is left untouched
+        structure = deque(structure)
+        queue = deque()
         while structure:
-            first = structure.pop(0)
+            first = structure.popleft()
             current = None
             children = []
             if isinstance(first, str):
@@ -622,7 +661,7 @@ class FEM(ObjDir):
             elif isinstance(first, list):
                 queue.append(first)
             if not structure and queue:
-                structure = queue.pop(0)
+                structure = deque(queue.popleft())
         return vols
 
     # Sensors --------------------------------------------------------------------------
@@ -671,7 +710,14 @@ class FEM(ObjDir):
         )
         with gmsh_open(self.mesh_path, logger) as gmsh:
             nodes_tags, nodes_coords = self._get_tissue_nodes(tissue, dim)
-            self._add_point_sensor(name, coords, nodes_tags, nodes_coords, tissue)
+            self._add_point_sensor(
+                name,
+                coords,
+                nodes_tags,
+                nodes_coords,
+                tissue,
+                self._get_max_group() + 1,
+            )
             gmsh.model.mesh.removeDuplicateNodes()
             gmsh.option.setNumber("Mesh.Binary", 1)
             gmsh.write(str(self.mesh_path))
@@ -702,21 +748,34 @@ class FEM(ObjDir):
         ValueError
             If argument `tissue` refers to a non existing tissue.
         """
-        coords = {s: tuple([1e-3 * x for x in c]) for s, c in coords.items()}
+        names = list(coords.keys())
+        # Convert [mm] to [m]
+        sensors_coords = 1e-3 * np.asarray(list(coords.values()), dtype=float)
+        sensors_coords = sensors_coords.reshape((-1, 3))
         if tissue not in self.tissues:
             raise ValueError(f"Tissue '{tissue}' not found in model.")
         dim = int(dim)
 
         logger.debug(
             (
-                f"Adding {len(coords)} sensors {'on' if dim == 2 else 'in'} "
-                f"tissue '{tissue}' with coords:\n{pformat(coords)}"
+                f"Adding {len(names)} sensors {'on' if dim == 2 else 'in'} "
+                f"tissue '{tissue}' with coords:\n{sensors_coords}"
             )
         )
         with gmsh_open(self.mesh_path, logger) as gmsh:
             nodes_tags, nodes_coords = self._get_tissue_nodes(tissue, dim)
-            for s, c in coords.items():
-                self._add_point_sensor(s, c, nodes_tags, nodes_coords, tissue)
+            # Find the closest node of every sensor at once
+            _, nodes_idx = cKDTree(nodes_coords).query(sensors_coords)
+            max_group = self._get_max_group()
+            for g, (s, c, i) in enumerate(zip(names, sensors_coords, nodes_idx), 1):
+                self._add_point_sensor_at(
+                    s,
+                    c,
+                    nodes_tags[i],
+                    nodes_coords[i, :].ravel(),
+                    tissue,
+                    max_group + g,
+                )
                 logger.info(
                     f"Sensor '{s}' added {'on' if dim == 2 else 'in'} tissue '{tissue}'."
                 )
@@ -750,10 +809,16 @@ class FEM(ObjDir):
             If argument `tissue` refers to a non existing tissue.
         """
         tsv_path = Path(tsv_path)
-        data = np.genfromtxt(
-            tsv_path, delimiter="\t", skip_header=1, dtype=None, encoding="utf-8"
+        data = np.loadtxt(
+            tsv_path,
+            delimiter="\t",
+            skiprows=1,
+            usecols=(0, 1, 2, 3),
+            dtype=str,
+            encoding="utf-8",
+            ndmin=2,
         )
-        coords = {str(d[0]): [float(d[1]), float(d[2]), float(d[3])] for d in data}
+        coords = dict(zip(data[:, 0].tolist(), data[:, 1:].astype(float).tolist()))
         logger.info(f"{len(coords)} sensors coordinates extracted from '{tsv_path}'.")
         logger.debug(pformat(coords))
         return self.add_point_sensors(coords, tissue, dim)
@@ -784,107 +849,140 @@ class FEM(ObjDir):
         TypeError
             If the argument `coords` is not of the right type.
         """
-        if name in self.sensors:
-            raise ValueError(f"Sensor '{name}' already exists in model.")
-        if not isinstance(coords, (Iterable, np.ndarray)):
-            raise TypeError("Argument 'coords' expects type Iterable or numpy.ndarray.")
-        if len(coords) != 3:
-            raise ValueError("Argument 'coords' must be a 3D coordinate.")
-        coords = tuple([1e-3 * c for c in coords])
-        if tissue not in self.tissues:
-            raise ValueError(f"Tissue '{tissue}' not found in model.")
+        self.add_circle_sensors_on({name: coords}, tissue, radius)
+
+    def _get_surf_mesh(self, tissue):
+        """Return the nodes and elements of the surface of a tissue.
 
+        The returned dict is updated by `_add_circle_sensor_gmsh` so multiple sensors
+        can be added without reading the mesh again.
+        """
         # WARNING: Only works with triangles, with single entity physical surfaces.
         surf = self.tissues[tissue].surf
-        with gmsh_open(self.mesh_path, logger) as gmsh:
-            nodes_tags, nodes_coords = self._get_tissue_nodes(tissue, 2)
-            # Get closest node
-            dist = cdist([coords], nodes_coords).ravel()
-            min_dist_idx = np.argmin(dist)
-            node_tag = nodes_tags[min_dist_idx]
-            mesh_coords = nodes_coords[min_dist_idx, :]
-            # Get surface elements
-            elems_type, elems_tags, elems_nodes_tags = gmsh.model.mesh.getElements(
-                2, surf.entities[0]
-            )
-            elems_type = elems_type[0]
-            elems_tags = elems_tags[0]
-            elems_nodes_tags = elems_nodes_tags[0].reshape((-1, 3))
-            elems_coords = gmsh.model.mesh.getBarycenters(
-                elems_type, surf.entities[0], False, False
-            ).reshape((-1, 3))
-            # Keep only elements in radius
-            dist = cdist([mesh_coords], elems_coords).ravel()
-            mask = dist <= radius
-            valid_elems_tags = elems_tags[mask]
-            valid_elems_nodes_tags = elems_nodes_tags[mask, :].ravel()
-            # Only keep elements directly connected to closest node
-            valid_elems_repeated = valid_elems_tags.repeat((3,))
-            nodes_to_check = [node_tag]
-            elems = []
-            nodes = []
-            while nodes_to_check:
-                current = nodes_to_check.pop(0)
-                nodes.append(current)
-                mask = valid_elems_nodes_tags == current
-                connected_elems = valid_elems_repeated[mask]
-                for e_t in connected_elems:
-                    elems.append(e_t)
-                    mask = valid_elems_repeated == e_t
-                    connected_nodes = valid_elems_nodes_tags[mask]
-                    for n_t in connected_nodes:
-                        if n_t not in nodes and n_t not in nodes_to_check:
-                            nodes_to_check.append(n_t)
-                    valid_elems_repeated = np.delete(valid_elems_repeated, mask)
-                    valid_elems_nodes_tags = np.delete(valid_elems_nodes_tags, mask)
-            mask = np.in1d(elems_tags, elems, assume_unique=True)
-            valid_elems_tags = elems_tags[mask]
-            valid_elems_nodes_tags = elems_nodes_tags[mask, :].ravel()
-            # Add surface sensor
-            surf_entity = gmsh.model.addDiscreteEntity(2)
-            gmsh.model.mesh.addElements(
-                2,
-                surf_entity,
-                [elems_type],
-                [valid_elems_tags],
-                [valid_elems_nodes_tags],
-            )
-            max_group = np.max([t for d, t in gmsh.model.getPhysicalGroups()])
-            surf_group = gmsh.model.addPhysicalGroup(2, [surf_entity], max_group + 1)
-            gmsh.model.setPhysicalName(2, surf_group, name)
-            # Remove elements from the tissue
-            new_entity = gmsh.model.addDiscreteEntity(2)
-            gmsh.model.mesh.addElements(
-                2,
-                new_entity,
-                [elems_type],
-                [elems_tags[~mask]],
-                [elems_nodes_tags[~mask, :].ravel()],
-            )
-            gmsh.model.removeEntities([(2, surf.entities[0])])
-            try:
-                gmsh.model.removePhysicalGroups([(2, surf.group)])
-            except:
-                pass
-            gmsh.model.removePhysicalName(tissue)
-            g = gmsh.model.addPhysicalGroup(2, [new_entity], surf.group)
-            gmsh.model.setPhysicalName(2, surf.group, tissue)
-            gmsh.model.setPhysicalName(3, self.tissues[tissue].vol.group, tissue)
-            gmsh.model.mesh.removeDuplicateNodes()
-            gmsh.model.mesh.reclassifyNodes()
-            gmsh.option.setNumber("Mesh.Binary", 1)
-            gmsh.write(str(self.mesh_path))
-        sensor = CircleSensor(
-            tissue, coords, mesh_coords, Group(2, [surf_entity], surf_group), radius
+        nodes_tags, nodes_coords = self._get_tissue_nodes(tissue, 2)
+        elems_type, elems_tags, elems_nodes_tags = gmsh.model.mesh.getElements(
+            2, surf.entities[0]
         )
-        self.tissues[tissue].surf["entities"] = [new_entity]
-        self.sensors[name] = sensor
-        self.save()
-        logger.info(f"Sensor '{name}' added.")
+        elems_nodes_tags = elems_nodes_tags[0].reshape((-1, 3))
+        order = np.argsort(nodes_tags)
+        elems_nodes_idx = order[
+            np.searchsorted(nodes_tags, elems_nodes_tags, sorter=order)
+        ]
+        return {
+            "nodes_tags": nodes_tags,
+            "nodes_coords": nodes_coords,
+            # Number of elements of the tissue each node belongs to
+            "nodes_count": np.bincount(
+                elems_nodes_idx.ravel(), minlength=nodes_tags.size
+            ),
+            "elems_type": elems_type[0],
+            "elems_tags": elems_tags[0],
+            "elems_nodes_tags": elems_nodes_tags,
+            "elems_nodes_idx": elems_nodes_idx,
+            "elems_coords": gmsh.model.mesh.getBarycenters(
+                elems_type[0], surf.entities[0], False, False
+            ).reshape((-1, 3)),
+        }
+
+    def _add_circle_sensor_gmsh(
+        self, gmsh, coords, tissue, radius, surf_group, surf_mesh
+    ):
+        """Add a circle sensor to the mesh currently opened in gmsh.
+
+        The elements of the sensor are removed from `surf_mesh`.
+
+        Returns
+        -------
+        int
+            The entity of the sensor.
+        numpy.ndarray
+            The coordinates of the node the sensor is centered on.
+        int
+            The new surface entity of the tissue.
+        """
+        surf = self.tissues[tissue].surf
+        elems_type = surf_mesh["elems_type"]
+        elems_tags = surf_mesh["elems_tags"]
+        elems_nodes_tags = surf_mesh["elems_nodes_tags"]
+        # Get closest node still belonging to the tissue
+        nodes_idx = np.flatnonzero(surf_mesh["nodes_count"])
+        nodes_coords = surf_mesh["nodes_coords"][nodes_idx, :]
+        min_dist_idx = nodes_idx[self._get_closest_node_idx(coords, nodes_coords)]
+        node_tag = surf_mesh["nodes_tags"][min_dist_idx]
+        mesh_coords = surf_mesh["nodes_coords"][min_dist_idx, :]
+        # Keep only elements in radius
+        offsets = surf_mesh["elems_coords"] - mesh_coords
+        mask = np.einsum("ij,ij->i", offsets, offsets) <= radius * radius
+        # Only keep elements connected to closest node
+        mask[mask] = self._get_connected_elems(elems_nodes_tags[mask, :], node_tag)
+        # The sensor is small compared to the surface so index it with integers
+        sensor_idx = np.flatnonzero(mask)
+        valid_elems_tags = elems_tags[sensor_idx]
+        valid_elems_nodes_tags = elems_nodes_tags[sensor_idx, :].ravel()
+        # Add surface sensor
+        surf_entity = gmsh.model.addDiscreteEntity(2)
+        gmsh.model.mesh.addElements(
+            2,
+            surf_entity,
+            [elems_type],
+            [valid_elems_tags],
+            [valid_elems_nodes_tags],
+        )
+        gmsh.model.addPhysicalGroup(2, [surf_entity], surf_group)
+        # Remove elements from the tissue and keep the remaining ones for next sensor
+        np.subtract.at(
+            surf_mesh["nodes_count"], surf_mesh["elems_nodes_idx"][sensor_idx, :], 1
+        )
+        keep = ~mask
+        for k in ("elems_tags", "elems_nodes_tags", "elems_nodes_idx", "elems_coords"):
+            surf_mesh[k] = surf_mesh[k][keep]
+        new_entity = gmsh.model.addDiscreteEntity(2)
+        gmsh.model.mesh.addElements(
+            2,
+            new_entity,
+            [elems_type],
+            [surf_mesh["elems_tags"]],
+            [surf_mesh["elems_nodes_tags"].ravel()],
+        )
+        gmsh.model.removeEntities([(2, surf.entities[0])])
+        try:
+            gmsh.model.removePhysicalGroups([(2, surf.group)])
+        except:
+            pass
+        gmsh.model.removePhysicalName(tissue)
+        gmsh.model.addPhysicalGroup(2, [new_entity], surf.group)
+        gmsh.model.setPhysicalName(2, surf.group, tissue)
+        gmsh.model.setPhysicalName(3, self.tissues[tissue].vol.group, tissue)
+        return surf_entity, mesh_coords, new_entity
+
+    @staticmethod
+    def _get_connected_elems(elems_nodes_tags, node_tag):
+        """Return a mask of the elements connected to a node through shared nodes.
+
+        Elements and nodes are the vertices of a bipartite graph whose connected
+        component containing the node gives the connected elements.
+        """
+        n_elems, n_elem_nodes = elems_nodes_tags.shape
+        nodes, nodes_idx = np.unique(elems_nodes_tags.ravel(), return_inverse=True)
+        start = np.searchsorted(nodes, node_tag)
+        if start == nodes.size or nodes[start] != node_tag:
+            return np.zeros((n_elems,), dtype=bool)
+        incidence = csr_matrix(
+            (
+                np.ones((nodes_idx.size,), dtype=bool),
+                (np.repeat(np.arange(n_elems), n_elem_nodes), nodes_idx.ravel()),
+            ),
+            shape=(n_elems, nodes.size),
+        )
+        graph = bmat([[None, incidence], [incidence.T, None]], format="csr")
+        _, labels = connected_components(graph, directed=False)
+        return labels[:n_elems] == labels[n_elems + start]
 
     def add_circle_sensors_on(self, coords, tissue, radius):
         """Add multiple circle sensors to the mesh.
 
+        The mesh is only read and written once, whatever the number of sensors.
+
         Parameters
         ----------
         coords : Mapping [str, Iterable [float]]
@@ -893,9 +991,49 @@ class FEM(ObjDir):
             The name of the tissue the sensor is on.
         radius : float
             The radius of the sensor [m].
+
+        Raises
+        ------
+        ValueError
+            If a sensor with one of the names already exists.
+            If the coordinates are not a 3D location.
+            If the tissue `tissue` does not exist in the model.
+        TypeError
+            If one of the coordinates is not of the right type.
         """
-        for n, c in coords.items():
-            self.add_circle_sensor_on(n, c, tissue, radius)
+        for name, c in coords.items():
+            if name in self.sensors:
+                raise ValueError(f"Sensor '{name}' already exists in model.")
+            if not isinstance(c, (Iterable, np.ndarray)):
+                raise TypeError(
+                    "Argument 'coords' expects type Iterable or numpy.ndarray."
+                )
+            if len(c) != 3:
+                raise ValueError("Argument 'coords' must be a 3D coordinate.")
+        if tissue not in self.tissues:
+            raise ValueError(f"Tissue '{tissue}' not found in model.")
+
+        sensors_coords = 1e-3 * np.asarray(list(coords.values()), dtype=float)
+        with gmsh_open(self.mesh_path, logger) as gmsh:
+            gmsh.option.setNumber("Mesh.Binary", 1)
+            max_group = self._get_max_group()
+            surf_mesh = self._get_surf_mesh(tissue)
+            for i, (name, c) in enumerate(zip(coords, sensors_coords), 1):
+                c = tuple(c.tolist())
+                surf_group = max_group + i
+                surf_entity, mesh_coords, new_entity = self._add_circle_sensor_gmsh(
+                    gmsh, c, tissue, radius, surf_group, surf_mesh
+                )
+                gmsh.model.setPhysicalName(2, surf_group, name)
+                self.sensors[name] = CircleSensor(
+                    tissue, c, mesh_coords, Group(2, [surf_entity], surf_group), radius
+                )
+                self.tissues[tissue].surf.entities = [new_entity]
+                logger.info(f"Sensor '{name}' added.")
+            gmsh.model.mesh.removeDuplicateNodes()
+            gmsh.model.mesh.reclassifyNodes()
+            gmsh.write(str(self.mesh_path))
+        self.save()
 
     def add_circle_sensors_from_tsv_on(self, tsv_path, tissue, radius):
         """Add multiple circle sensors to the mesh from a TSV file.
@@ -910,10 +1048,16 @@ class FEM(ObjDir):
             The radius of the sensor [m].
         """
         tsv_path = Path(tsv_path)
-        data = np.genfromtxt(
-            tsv_path, delimiter="\t", skip_header=1, dtype=None, encoding="utf-8"
+        data = np.loadtxt(
+            tsv_path,
+            delimiter="\t",
+            skiprows=1,
+            usecols=(0, 1, 2, 3),
+            dtype=str,
+            encoding="utf-8",
+            ndmin=2,
         )
-        coords = {str(d[0]): [float(d[1]), float(d[2]), float(d[3])] for d in data}
+        coords = dict(zip(data[:, 0].tolist(), data[:, 1:].astype(float).tolist()))
         logger.info(f"{len(coords)} sensors coordinates extracted from '{tsv_path}'.")
         logger.debug(pformat(coords))
         return self.add_circle_sensors_on(coords, tissue, radius)
@@ -966,8 +1110,7 @@ class FEM(ObjDir):
         gmsh.open(str(self.mesh_path))
         nodes_tags, nodes_coords = self._get_tissue_nodes(tissue, 2)
         # Get closest node
-        dist = cdist([coords], nodes_coords).ravel()
-        min_dist_idx = np.argmin(dist)
+        min_dist_idx = self._get_closest_node_idx(coords, nodes_coords)
         node_tag = nodes_tags[min_dist_idx]
         mesh_coords = nodes_coords[min_dist_idx, :]
         # Get surface elements
@@ -985,29 +1128,9 @@ class FEM(ObjDir):
         mask = np.apply_along_axis(
             lambda c: np.all(np.abs(c) < shape / 2), 1, elems_coords_2d
         )
-        valid_elems_tags, elems_coords = (elems_tags[mask], elems_coords[mask])
-        valid_elems_nodes_tags = elems_nodes_tags[mask].ravel()
-        logger.debug(f"{valid_elems_tags.size} elements close to the plane.")
-        # Only keep elements directly connected to closest node
-        valid_elems_repeated = valid_elems_tags.repeat((3,))
-        nodes_to_check = [node_tag]
-        elems = []
-        nodes = []
-        while nodes_to_check:
-            current = nodes_to_check.pop(0)
-            nodes.append(current)
-            mask = valid_elems_nodes_tags == current
-            connected_elems = valid_elems_repeated[mask]
-            for e_t in connected_elems:
-                elems.append(e_t)
-                mask = valid_elems_repeated == e_t
-                connected_nodes = valid_elems_nodes_tags[mask]
-                for n_t in connected_nodes:
-                    if n_t not in nodes and n_t not in nodes_to_check:
-                        nodes_to_check.append(n_t)
-                valid_elems_repeated = np.delete(valid_elems_repeated, mask)
-                valid_elems_nodes_tags = np.delete(valid_elems_nodes_tags, mask)
-        mask = np.in1d(elems_tags, elems, assume_unique=True)
+        logger.debug(f"{np.count_nonzero(mask)} elements close to the plane.")
+        # Only keep elements connected to closest node
+        mask[mask] = self._get_connected_elems(elems_nodes_tags[mask, :], node_tag)
         valid_elems_tags = elems_tags[mask]
         valid_elems_nodes_tags = elems_nodes_tags[mask, :].ravel()
         logger.debug(f"{valid_elems_tags.size} valid elements.")
@@ -1016,8 +1139,9 @@ class FEM(ObjDir):
         gmsh.model.mesh.addElements(
             2, surf_entity, [elems_type], [valid_elems_tags], [valid_elems_nodes_tags],
         )
-        max_group = np.max([t for d, t in gmsh.model.getPhysicalGroups()])
-        surf_group = gmsh.model.addPhysicalGroup(2, [surf_entity], max_group + 1)
+        surf_group = gmsh.model.addPhysicalGroup(
+            2, [surf_entity], self._get_max_group() + 1
+        )
         gmsh.model.setPhysicalName(2, surf_group, name)
         # Remove elements from the tissue
         new_entity = gmsh.model.addDiscreteEntity(2)
@@ -1050,7 +1174,7 @@ class FEM(ObjDir):
             shape[0],
             shape[1],
         )
-        self.tissues[tissue].surf["entities"] = [new_entity]
+        self.tissues[tissue].surf.entities = [new_entity]
         self.sensors[name] = sensor
         self.save()
         logger.info(f"Sensor '{name}' added.")
@@ -1073,34 +1197,53 @@ class FEM(ObjDir):
         )
         nodes = [gmsh.model.mesh.getNodes(dim, e, True)[:2] for e in entities]
         logger.debug(f"Acquired {nodes[0][0].size} nodes:\n{nodes}")
-        tags = np.hstack([t for t, _ in nodes])
-        coords = np.hstack([c for _, c in nodes]).reshape((-1, 3))
+        tags = _concat([t for t, _ in nodes])
+        coords = _concat([c for _, c in nodes]).reshape((-1, 3))
         return tags, coords
 
     _get_tissue_surf_nodes = partialmethod(_get_tissue_nodes, dim=2)
     _get_tissue_vol_nodes = partialmethod(_get_tissue_nodes, dim=3)
 
-    def _add_point_sensor(self, name, coords, nodes_tags, nodes_coords, tissue):
+    def _add_point_sensor(self, name, coords, nodes_tags, nodes_coords, tissue, group):
         """Add a point sensor."""
-        dist = cdist([coords], nodes_coords).ravel()
-        min_dist_idx = np.argmin(dist)
-        node_tag = nodes_tags[min_dist_idx]
-        mesh_coords = nodes_coords[min_dist_idx, :].ravel()
-        entity, group = self._add_point_sensor_on_node(name, node_tag, mesh_coords)
+        min_dist_idx = self._get_closest_node_idx(coords, nodes_coords)
+        self._add_point_sensor_at(
+            name,
+            coords,
+            nodes_tags[min_dist_idx],
+            nodes_coords[min_dist_idx, :].ravel(),
+            tissue,
+            group,
+        )
+
+    @staticmethod
+    def _get_max_group():
+        """Return the highest physical group tag of the model opened in gmsh."""
+        return max((t for _, t in gmsh.model.getPhysicalGroups(-1)), default=0)
+
+    @staticmethod
+    def _get_closest_node_idx(coords, nodes_coords):
+        """Return the index of the node closest to the coordinates."""
+        # |n - c|^2 = |n|^2 - 2 n.c + |c|^2 where |c|^2 does not change the argmin
+        nodes_sq = np.einsum("ij,ij->i", nodes_coords, nodes_coords)
+        return int(np.argmin(nodes_sq - 2.0 * (nodes_coords @ np.asarray(coords))))
+
+    def _add_point_sensor_at(self, name, coords, node_tag, mesh_coords, tissue, group):
+        """Add a point sensor on an already known node."""
+        entity = self._add_point_sensor_on_node(name, node_tag, mesh_coords, group)
         sensor = PointSensor(
             tissue, coords, mesh_coords, Group(0, [entity], group), node_tag
         )
         self["sensors"][name] = sensor
 
-    def _add_point_sensor_on_node(self, name, node_tag, node_coords):
-        """Add a point sensor on a node."""
+    def _add_point_sensor_on_node(self, name, node_tag, node_coords, group):
+        """Add a point sensor on a node with physical group tag `group`."""
         entity = gmsh.model.addDiscreteEntity(0)
         gmsh.model.mesh.addNodes(0, entity, [node_tag], node_coords)
         gmsh.model.mesh.addElementsByType(entity, 15, [], [node_tag])
-        max_group = max([tag for dim, tag in gmsh.model.getPhysicalGroups(-1)])
-        group = gmsh.model.addPhysicalGroup(0, [entity], max_group + 1)
+        gmsh.model.addPhysicalGroup(0, [entity], group)
         gmsh.model.setPhysicalName(0, group, name)
-        return entity, group
+        return entity
 
     # Fields ---------------------------------------------------------------------------
 
@@ -1251,10 +1394,11 @@ class FEM(ObjDir):
             raise TypeError("Argument 'affine' expects type numpy.ndarray.")
         if affine.shape not in ((3, 4), (4, 4)):
             raise ValueError("Argument 'affine' expects shape (3,4) or (4,4).")
-        affine = np.vstack((affine[:3, :], np.array([0, 0, 0, 1])))
+        affine = affine[:3, :]
         # Convert [mm] to [m]
         if resize:
-            affine = np.diag([1e-3] * 3 + [1]) @ affine
+            affine = 1e-3 * affine
+        affine = np.vstack((affine, [0, 0, 0, 1]))
         if tissue not in self.tissues:
             raise KeyError(f"Tissue '{tissue}' not found in model.")
 
@@ -1319,7 +1463,15 @@ class FEM(ObjDir):
             entities = self.tissues[tissue].surf.entities
         elif dim == 3:
             entities = self.tissues[tissue].vol.entities
-        return np.hstack([gmsh.model.mesh.getElements(dim, e)[1] for e in entities])
+        cache = self._get_mesh_cache()
+        key = ("elems", dim, tuple(entities))
+        if key not in cache:
+            elems = _concat(
+                [t for e in entities for t in gmsh.model.mesh.getElements(dim, e)[1]]
+            )
+            elems.flags.writeable = False
+            cache[key] = elems
+        return cache[key]
 
     _get_tissue_surf_elems = partialmethod(_get_tissue_elems, dim=2)
     _get_tissue_vol_elems = partialmethod(_get_tissue_elems, dim=3)
@@ -1334,12 +1486,20 @@ class FEM(ObjDir):
         elif dim == 3:
             entities = self.tissues[tissue].vol.entities
             elems_type = 4  # Tetrahedron
-        return np.hstack(
-            [
-                gmsh.model.mesh.getBarycenters(elems_type, e, fast=False, primary=False)
-                for e in entities
-            ]
-        ).reshape((-1, 3))
+        cache = self._get_mesh_cache()
+        key = ("elems_coords", dim, tuple(entities))
+        if key not in cache:
+            coords = _concat(
+                [
+                    gmsh.model.mesh.getBarycenters(
+                        elems_type, e, fast=False, primary=False
+                    )
+                    for e in entities
+                ]
+            ).reshape((-1, 3))
+            coords.flags.writeable = False
+            cache[key] = coords
+        return cache[key]
 
     _get_tissue_surf_elems_coords = partialmethod(_get_tissue_elems_coords, dim=2)
     _get_tissue_vol_elems_coords = partialmethod(_get_tissue_elems_coords, dim=3)
@@ -1347,17 +1507,19 @@ class FEM(ObjDir):
     def _fill_empty_field_elems(self, tissue, elems_tags, elems_vals, n_vals, fill_val):
         """Add a default value to empty elements."""
         all_elems_tags = self._get_tissue_vol_elems(tissue)
-        empty_elems_idx = np.isin(
-            all_elems_tags, elems_tags, assume_unique=True, invert=True
-        )
-        if np.any(empty_elems_idx):
-            logger.debug(f"Filling {np.nonzero(empty_elems_idx).size} elements.")
-            empty_elems_tags = all_elems_tags[empty_elems_idx]
-            empty_elems_vals = np.broadcast_to(
-                np.array(fill_val), (1, int(empty_elems_tags.size * n_vals))
-            ).ravel()
-            elems_tags = np.hstack((elems_tags.ravel(), empty_elems_tags))
-            elems_vals = np.hstack((elems_vals.ravel(), empty_elems_vals))
+        empty_elems_mask = ~_isin_sorted(all_elems_tags, np.sort(elems_tags.ravel()))
+        n_empty = int(empty_elems_mask.sum())
+        if n_empty:
+            logger.debug(f"Filling {n_empty} elements.")
+            n_elems = elems_tags.size
+            out_tags = np.empty((n_elems + n_empty,), dtype=all_elems_tags.dtype)
+            out_tags[:n_elems] = elems_tags.ravel()
+            out_tags[n_elems:] = all_elems_tags[empty_elems_mask]
+            dtype = np.result_type(elems_vals, fill_val)
+            out_vals = np.empty(((n_elems + n_empty) * n_vals,), dtype=dtype)
+            out_vals[: n_elems * n_vals] = elems_vals.ravel()
+            out_vals[n_elems * n_vals :].reshape((-1, n_vals))[:] = fill_val
+            return out_tags, out_vals
         return elems_tags, elems_vals
 
     def _add_field_view(self, name, tissue, elems_tags, elems_vals, n_vals):
@@ -1373,15 +1535,67 @@ class FEM(ObjDir):
 
     def _interp_field(self, tissue, field, affine, method, fill_val):
         """Interpolate a field on a mesh grid."""
-        x = np.arange(field.shape[0])
-        y = np.arange(field.shape[1])
-        z = np.arange(field.shape[2])
-        interpolate = RegularGridInterpolator(
-            (x, y, z), field, method=method, bounds_error=False, fill_value=fill_val
-        )
         with gmsh_open(self.mesh_path, logger) as gmsh:
             elems_tags = self._get_tissue_vol_elems(tissue)
             elems_coords = self._get_tissue_vol_elems_coords(tissue)
         inv_affine = np.linalg.inv(affine)
-        elems_vals = interpolate(nib.affines.apply_affine(inv_affine, elems_coords))
-        return elems_tags, elems_vals
+        vox_coords = nib.affines.apply_affine(inv_affine, elems_coords).T
+        order = 0 if method == "nearest" else 1
+        # Interpolate each component separately since `cval` must be a scalar
+        comps = field.reshape(field.shape[:3] + (-1,))
+        fill_vals = np.broadcast_to(np.ravel(fill_val), (comps.shape[-1],))
+        elems_vals = np.empty((elems_tags.size, comps.shape[-1]))
+        for i, v in enumerate(fill_vals):
+            map_coordinates(
+                comps[..., i],
+                vox_coords,
+                output=elems_vals[:, i],
+                order=order,
+                mode="constant",
+                cval=v,
+            )
+        return elems_tags, elems_vals.reshape((-1,) + field.shape[3:])
+
+
+def _crop_labels(labels, affine):
+    """Crop the background of a labelled volume and update its affine matrix.
+
+    As with `nilearn.image.crop_img`, a margin of one voxel is kept around the
+    labelled region whenever possible.
+    """
+    slices = find_objects((labels > 0).view(np.uint8))
+    if not slices:
+        return labels, affine
+    start = np.array([max(s.start - 1, 0) for s in slices[0]])
+    end = np.minimum([s.stop + 1 for s in slices[0]], labels.shape)
+    cropped = labels[tuple(slice(b, e) for b, e in zip(start, end))]
+    cropped_affine = affine.copy()
+    cropped_affine[:3, 3] = affine[:3, :3] @ start + affine[:3, 3]
+    return cropped, cropped_affine
+
+
+def _concat(arrays):
+    """Concatenate 1D arrays, without copying if there is a single one."""
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.concatenate(arrays)
+
+
+def _isin_sorted(values, sorted_values):
+    """Return a mask of the elements of `values` found in a sorted array.
+
+    Unlike `numpy.isin` with `assume_unique=True`, `sorted_values` may contain
+    duplicates.
+    """
+    if sorted_values.size == 0:
+        return np.zeros(values.shape, dtype=bool)
+    idx = np.searchsorted(sorted_values, values)
+    idx.clip(0, sorted_values.size - 1, out=idx)
+    return sorted_values[idx] == values
+
+
+def _load_mask(path):
+    """Load a binary mask and its affine matrix from a NIFTI file."""
+    img = nib.load(str(path))
+    # Read the mask in its stored type instead of float64
+    return np.asanyarray(img.dataobj).astype(bool, copy=False), img.affine
@@ -4,9 +4,11 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class Field(dict):
+class Field:
     """A FEM field.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     field_type : str
@@ -24,6 +26,8 @@ class Field(dict):
         - 'sigma[tissue]'
     """
 
+    __slots__ = ("field_type", "view", "formula")
+
     SCALAR = "scalar"
     VECTOR = "vector"
     TENSOR = "tensor"
@@ -34,42 +38,49 @@ class Field(dict):
             raise ValueError(
                 "Argument 'field_type' must be one of 'scalar', 'vector' or 'tensor'."
             )
-        super().__init__(
-            {"field_type": field_type, "view": int(view), "formula": formula}
-        )
+        self.field_type = field_type
+        self.view = int(view)
+        self.formula = formula
 
-    @property
-    def field_type(self):
-        """Return the type of the fied.
+    def __eq__(self, other):
+        if not isinstance(other, Field):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
 
-        Returns
-        -------
-        str
-            The type of the field.
-        """
-        return self["field_type"]
+    __hash__ = None
+
+    def __repr__(self):
+        params = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({params})"
 
-    @property
-    def view(self):
-        """Return the view corresponding to the field.
+    def to_dict(self):
+        """Return the dict representation of the field.
 
         Returns
         -------
-        int
-            The view corresponding to the field.
+        dict [str, Any]
+            The dict representation of the field.
         """
-        return self["view"]
+        return {n: getattr(self, n) for n in self.__slots__}
 
-    @property
-    def formula(self):
-        """Return the formula linking the field to a physical property.
+    @classmethod
+    def from_dict(cls, data):
+        """Return a field from its dict representation.
+
+        Parameters
+        ----------
+        data : dict [str, Any] or shamo.fem.Field
+            The dict representation of the field. If `data` already is a field, it is
+            returned as is.
 
         Returns
         -------
-        str
-            The formula linking the field to a physical property.
+        shamo.fem.Field
+            The field.
         """
-        return self["formula"]
+        if isinstance(data, Field):
+            return data
+        return cls(**data)
 
     def gen_formula(self, **kwargs):
         """Generate the formula to use the field in a property.
@@ -5,9 +5,11 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-class Group(dict):
+class Group:
     """A FEM physical group.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     dim : int
@@ -26,6 +28,8 @@ class Group(dict):
         If argument `group` is not convertible to `int`.
     """
 
+    __slots__ = ("dim", "entities", "group")
+
     DIM_POINT = 0
     DIM_LINE = 1
     DIM_SURF = 2
@@ -34,31 +38,49 @@ class Group(dict):
     def __init__(self, dim, entities, group):
         if not isinstance(entities, Iterable):
             entities = [entities]
-        super().__init__(
-            {"dim": int(dim), "entities": entities, "group": int(group),}
-        )
+        self.dim = int(dim)
+        self.entities = list(entities)
+        self.group = int(group)
 
-    @property
-    def dim(self):
-        """Return the dimension of the physical group.
+    def __eq__(self, other):
+        if not isinstance(other, Group):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self):
+        params = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({params})"
+
+    def to_dict(self):
+        """Return the dict representation of the physical group.
 
         Returns
         -------
-        int
-            The dimension of the physical group.
+        dict [str, Any]
+            The dict representation of the physical group.
         """
-        return self["dim"]
+        return {n: getattr(self, n) for n in self.__slots__}
 
-    @property
-    def entities(self):
-        """Return the tags of the entities composing the physical group.
+    @classmethod
+    def from_dict(cls, data):
+        """Return a physical group from its dict representation.
+
+        Parameters
+        ----------
+        data : dict [str, Any] or shamo.fem.Group
+            The dict representation of the physical group. If `data` already is a
+            physical group, it is returned as is.
 
         Returns
         -------
-        set [int]
-            The tags of the entities composing the physical group.
+        shamo.fem.Group
+            The physical group.
         """
-        return self["entities"]
+        if isinstance(data, Group):
+            return data
+        return cls(**data)
 
     @property
     def n_entities(self):
@@ -70,14 +92,3 @@ class Group(dict):
             The number of entities composing the physical group.
         """
         return len(self.entities)
-
-    @property
-    def group(self):
-        """Return the tag of the physical group.
-
-        Returns
-        -------
-        int
-            The tag of the physical group.
-        """
-        return self["group"]
@@ -1,9 +1,12 @@
 """Implement the `Sensor` class."""
+import sys
 
 
-class SensorABC(dict):
+class SensorABC:
     """A FEM sensor.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     tissue : str
@@ -16,63 +19,69 @@ class SensorABC(dict):
         The type of the sensor.
     """
 
+    __slots__ = ("tissue", "sensor_type", "real_coords", "mesh_coords")
+
     TYPE_POINT = "point"
     TYPE_CIRCLE = "circle"
     TYPE_RECT = "rect"
 
     def __init__(self, tissue, sensor_type, real_coords, mesh_coords):
-        super().__init__(
-            {
-                "tissue": tissue,
-                "sensor_type": sensor_type,
-                "real_coords": tuple(real_coords),
-                "mesh_coords": tuple(mesh_coords),
-            }
-        )
-
-    @property
-    def real_coords(self):
-        """Return the real coordinates of the sensor.
+        # Many sensors share the same tissue and type so only keep one copy of each
+        self.tissue = sys.intern(tissue)
+        self.sensor_type = sys.intern(sensor_type)
+        self.real_coords = tuple(real_coords)
+        self.mesh_coords = tuple(mesh_coords)
 
-        Returns
-        -------
-        tuple (float, float, float)
-            The real coordinates of the sensor [m].
-        """
-        return self["real_coords"]
+    def __eq__(self, other):
+        if not isinstance(other, SensorABC):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
 
-    @property
-    def mesh_coords(self):
-        """Return the mesh coordinates of the sensor.
+    __hash__ = None
 
-        Returns
-        -------
-        tuple (float, float, float)
-            The mesh coordinates of the sensor [m].
-        """
-        return self["mesh_coords"]
+    def __repr__(self):
+        params = ", ".join(f"{n}={getattr(self, n)!r}" for n in self._get_fields())
+        return f"{type(self).__name__}({params})"
+
+    @classmethod
+    def _get_fields(cls):
+        """Return the names of the attributes of the sensor."""
+        return [
+            n for c in reversed(cls.__mro__) for n in c.__dict__.get("__slots__", ())
+        ]
 
-    @property
-    def tissue(self):
-        """Return the tissue the sensor is in.
+    def to_dict(self):
+        """Return the dict representation of the sensor.
 
         Returns
         -------
-        str
-            The tissue the sensor is in.
+        dict [str, Any]
+            The dict representation of the sensor.
         """
-        return self["tissue"]
+        data = {}
+        for n in self._get_fields():
+            value = getattr(self, n)
+            data[n] = value.to_dict() if hasattr(value, "to_dict") else value
+        return data
+
+    @staticmethod
+    def from_dict(data):
+        """Return a sensor from its dict representation.
 
-    @property
-    def sensor_type(self):
-        """Return the type of the sensor.
+        Parameters
+        ----------
+        data : dict [str, Any] or shamo.fem.SensorABC
+            The dict representation of the sensor. If `data` already is a sensor, it
+            is returned as is.
 
         Returns
         -------
-        str
-            The type of the sensor.
+        shamo.fem.SensorABC
+            The sensor.
         """
-        return self["sensor_type"]
+        if isinstance(data, SensorABC):
+            return data
+        return SensorABC.load(**data)
 
     @staticmethod
     def load(sensor_type, **kwargs):
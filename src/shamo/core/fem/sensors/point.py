@@ -7,6 +7,8 @@ from shamo.core.fem import SensorABC, Group
 class PointSensor(SensorABC):
     """A FEM sensor.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     tissue : str
@@ -17,28 +19,9 @@ class PointSensor(SensorABC):
         The tag of the node corresponding to the sensor.
     """
 
+    __slots__ = ("point", "node")
+
     def __init__(self, tissue, real_coords, mesh_coords, point, node, **kwargs):
         super().__init__(tissue, SensorABC.TYPE_POINT, real_coords, mesh_coords)
-        self.update({"point": Group(**point), "node": int(node)})
-
-    @property
-    def point(self):
-        """Return the group of the sensor.
-
-        Returns
-        -------
-        shamo.fem.Group
-            The group of the sensor.
-        """
-        return self["point"]
-
-    @property
-    def node(self):
-        """Return the node tag of the sensor.
-
-        Returns
-        -------
-        int
-            The node tag of the sensor.
-        """
-        return self["node"]
+        self.point = Group.from_dict(point)
+        self.node = int(node)
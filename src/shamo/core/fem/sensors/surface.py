@@ -5,6 +5,8 @@ from shamo.core.fem import SensorABC, Group
 class SurfSensorABC(SensorABC):
     """The base class for any surfacic sensor.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     tissue : str
@@ -17,31 +19,18 @@ class SurfSensorABC(SensorABC):
         The physical group of the sensor.
     """
 
+    __slots__ = ("surf",)
+
     def __init__(self, tissue, sensor_type, real_coords, mesh_coords, surf, **kwargs):
         super().__init__(tissue, sensor_type, real_coords, mesh_coords)
-        self.update(
-            {
-                "real_coords": tuple(real_coords),
-                "mesh_coords": tuple(mesh_coords),
-                "surf": Group(**surf),
-            }
-        )
-
-    @property
-    def surf(self):
-        """Return the group of the sensor.
-
-        Returns
-        -------
-        shamo.fem.Group
-            The group of the sensor.
-        """
-        return self["surf"]
+        self.surf = Group.from_dict(surf)
 
 
 class CircleSensor(SurfSensorABC):
     """A circular sensor.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     tissue : str
@@ -56,25 +45,18 @@ class CircleSensor(SurfSensorABC):
         The radius of the sensor.
     """
 
+    __slots__ = ("radius",)
+
     def __init__(self, tissue, real_coords, mesh_coords, surf, radius, **kwargs):
         super().__init__(tissue, SensorABC.TYPE_CIRCLE, real_coords, mesh_coords, surf)
-        self.update({"radius": float(radius)})
-
-    @property
-    def radius(self):
-        """Return the radius of the sensor.
-
-        Returns
-        -------
-        float
-            The radius of the sensor.
-        """
-        return self["radius"]
+        self.radius = float(radius)
 
 
 class RectSensor(SurfSensorABC):
     """A rectangular sensor.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     tissue : str
@@ -91,28 +73,9 @@ class RectSensor(SurfSensorABC):
         The height of the rectangle.
     """
 
+    __slots__ = ("width", "height")
+
     def __init__(self, tissue, real_coords, mesh_coords, surf, width, height, **kwargs):
         super().__init__(tissue, SensorABC.TYPE_RECT, real_coords, mesh_coords, surf)
-        self.update({"width": float(width), "height": float(height)})
-
-    @property
-    def width(self):
-        """Return the width of the sensor.
-
-        Returns
-        -------
-        float
-            The width of the sensor.
-        """
-        return self["width"]
-
-    @property
-    def height(self):
-        """Return the height of the sensor.
-
-        Returns
-        -------
-        float
-            The height of the sensor.
-        """
-        return self["height"]
+        self.width = float(width)
+        self.height = float(height)
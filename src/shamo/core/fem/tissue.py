@@ -2,9 +2,11 @@
 from . import Group, Field
 
 
-class Tissue(dict):
+class Tissue:
     """A FEM tissue.
 
+    The parameters are stored as attributes of the same name.
+
     Parameters
     ----------
     surf : dict [str, int or Iterable [int]] or shamo.fem.Group
@@ -15,44 +17,53 @@ class Tissue(dict):
         The fields defined in th tissue.
     """
 
+    __slots__ = ("surf", "vol", "fields")
+
     def __init__(self, surf, vol, fields={}):
-        super().__init__(
-            {
-                "surf": Group(**surf),
-                "vol": Group(**vol),
-                "fields": {n: Field(**f) for n, f in fields.items()},
-            }
-        )
-
-    @property
-    def surf(self):
-        """Return the surface group of the tissue.
+        self.surf = Group.from_dict(surf)
+        self.vol = Group.from_dict(vol)
+        self.fields = {n: Field.from_dict(f) for n, f in fields.items()}
 
-        Returns
-        -------
-        shamo.fem.Group
-            The surface group of the tissue.
-        """
-        return self["surf"]
+    def __eq__(self, other):
+        if not isinstance(other, Tissue):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
 
-    @property
-    def vol(self):
-        """Return the volume group of the tissue.
+    def __repr__(self):
+        params = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({params})"
+
+    def to_dict(self):
+        """Return the dict representation of the tissue.
 
         Returns
         -------
-        shamo.fem.Group
-            The volume group of the tissue.
+        dict [str, Any]
+            The dict representation of the tissue.
         """
-        return self["vol"]
+        return {
+            "surf": self.surf.to_dict(),
+            "vol": self.vol.to_dict(),
+            "fields": {n: f.to_dict() for n, f in self.fields.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Return a tissue from its dict representation.
 
-    @property
-    def fields(self):
-        """Return the fields of the tissue.
+        Parameters
+        ----------
+        data : dict [str, Any] or shamo.fem.Tissue
+            The dict representation of the tissue. If `data` already is a tissue, it is
+            returned as is.
 
         Returns
         -------
-        dict [str, shamo.fem.Field]
-            The fields of the tissue.
+        shamo.fem.Tissue
+            The tissue.
         """
-        return self["fields"]
+        if isinstance(data, Tissue):
+            return data
+        return cls(**data)
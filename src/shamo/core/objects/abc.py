@@ -4,6 +4,11 @@ import json
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,8 +107,7 @@ class ObjABC(dict, ABC):
                     "If you want to override it, set argument 'exist_ok' to True."
                 )
             )
-        with open(self.json_path, "w") as f:
-            json.dump(self, f, indent=4, sort_keys=True)
+        self.json_path.write_bytes(_dumps(self))
 
     @abstractclassmethod
     def _split_json_path(cls, json_path):
@@ -143,6 +147,51 @@ class ObjABC(dict, ABC):
             raise FileNotFoundError(f"File '{str(json_path)}' does not exist.")
         if not json_path.suffix == ".json":
             raise ValueError(f"Argument 'json_path' must end with '.json'.")
-        with open(json_path, "r") as f:
-            data = json.load(f)
+        data = _loads(json_path.read_bytes())
         return cls(*cls._split_json_path(json_path), **data)
+
+
+def _to_json(obj):
+    """Return a JSON serializable representation of an object.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize. It must implement a `to_dict` method.
+
+    Returns
+    -------
+    dict [str, Any]
+        The JSON serializable representation of the object.
+
+    Raises
+    ------
+    TypeError
+        If `obj` does not implement a `to_dict` method.
+    """
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable.")
+
+
+def _dumps(obj):
+    """Return the JSON representation of an object as bytes.
+
+    `json` is always used so the content of the files does not depend on the installed
+    packages. `orjson` would write non-finite floats as ``null``.
+    """
+    return json.dumps(obj, indent=4, sort_keys=True, default=_to_json).encode()
+
+
+def _loads(data):
+    """Return the object represented by a JSON document.
+
+    `orjson` is used if it is installed and `json` otherwise.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by `json` may contain `NaN` or `Infinity`
+            pass
+    return json.loads(data)
@@ -23,7 +23,12 @@ class ObjDir(ObjABC):
 
     def __init__(self, name, parent_path):
         super().__init__(name, parent_path)
-        self.path.mkdir(parents=True, exist_ok=True)
+        # The name and the parent path never change so the paths are built once
+        self._path = self.parent_path / name
+        self._json_path = self._path / f"{name}.json"
+        # Loading an object is the common case and its directory already exists
+        if not self._path.is_dir():
+            self._path.mkdir(parents=True, exist_ok=True)
 
     @property
     def path(self):
@@ -34,7 +39,7 @@ class ObjDir(ObjABC):
         pathlib.Path
             The path to the object directory.
         """
-        return self.parent_path / self.name
+        return self._path
 
     @property
     def json_path(self):
@@ -45,7 +50,7 @@ class ObjDir(ObjABC):
         pathlib.Path
             The path to the object JSON file.
         """
-        return self.path / f"{self.name}.json"
+        return self._json_path
 
     @classmethod
     def _split_json_path(cls, json_path):
@@ -19,6 +19,11 @@ class ObjFile(ObjABC):
     shamo.core.ObjABC
     """
 
+    def __init__(self, name, parent_path):
+        super().__init__(name, parent_path)
+        # The name and the parent path never change so the path is built once
+        self._json_path = self.parent_path / f"{name}.json"
+
     @property
     def path(self):
         """An alias for `json_path`.
@@ -39,7 +44,7 @@ class ObjFile(ObjABC):
         pathlib.Path
             The path to the object JSON file.
         """
-        return self.parent_path / f"{self.name}.json"
+        return self._json_path
 
     @classmethod
     def _split_json_path(cls, json_path):
@@ -1,10 +1,12 @@
 """Implement `ProbParamABC` class."""
 from abc import abstractmethod, abstractproperty
+from functools import lru_cache, partial
 import itertools as iter
 import logging
 import multiprocessing as mp
 from pathlib import Path
 import re
+import sys
 
 import chaospy as chaos
 from jinja2 import Environment, PackageLoader
@@ -14,6 +16,9 @@ from shamo.core.problems.single import ProbABC
 
 logger = logging.getLogger(__name__)
 
+# Matches the `prop.name` names of the parameters
+_PROP_NAME_RE = re.compile(r"^(?P<prop>[a-zA-Z]+)\.(?P<name>\w+)$")
+
 
 class ProbParamABC(ProbABC):
     """A base class for any parametric problem."""
@@ -73,10 +78,14 @@ class ProbParamABC(ProbABC):
             raise RuntimeError(
                 "No varying parameter was found. Use 'ProbEEGLeadfield' instead."
             )
-        dist = chaos.J(*[p[0].uniform_dist for _, p in varying])
-        x = dist.sample(n_evals + skip, rule="halton").reshape((len(dist), -1))
-        if skip != 0:
-            x = x[:, skip:]
+        # Draw the points in the unit hypercube and scale them to the bounds of the
+        # uniform distributions instead of building a joint distribution
+        uniform_dists = [p[0].uniform_dist for _, p in varying]
+        lower = np.concatenate([d.lower for d in uniform_dists])
+        upper = np.concatenate([d.upper for d in uniform_dists])
+        x = chaos.create_halton_samples(n_evals + skip, len(uniform_dists))
+        x = x.reshape((len(uniform_dists), -1))[:, skip:]
+        x = lower[:, np.newaxis] + x * (upper - lower)[:, np.newaxis]
         params = {}
         for i, (n, p) in enumerate(varying):
             prop, name = ProbParamABC._split_prop_name(n)
@@ -87,13 +96,13 @@ class ProbParamABC(ProbABC):
             prop, name = ProbParamABC._split_prop_name(n)
             if prop not in params:
                 params[prop] = {}
-            params[prop][name] = [np.ones((x.shape[1],)) * p[0], p[1]]
+            params[prop][name] = [np.full(x.shape[1], p[0], dtype=float), p[1]]
         return params
 
     @staticmethod
     def _split_prop_name(name):
         """Split the names of the parameters."""
-        match = re.match(r"^(?P<prop>[a-zA-Z]+)\.(?P<name>\w+)$", name)
+        match = _PROP_NAME_RE.match(name)
         return match.group("prop"), match.group("name")
 
     @abstractmethod
@@ -161,9 +170,7 @@ class ProbParamABC(ProbABC):
         -------
         list []
         """
-        logger.info("Generating python files.")
-        env = Environment(loader=PackageLoader("shamo", "templates/py"))
-        template = env.get_template(self.template)
+        template = _get_template(self.template)
         content = template.render(
             problem=prob,
             name=name,
@@ -202,19 +209,31 @@ class ProbParamABC(ProbABC):
         the resolution.
         """
         logger.info(f"Solving {len(sub_probs)} sub-problems.")
-        generator = (
-            [p, f"{sol.name}_{i:08d}", sol.path, kwargs]
-            for i, p in enumerate(sub_probs)
-        )
+        sol_name, sol_path = sol.name, sol.path
+        tasks = [(p, f"{sol_name}_{i:08d}", sol_path) for i, p in enumerate(sub_probs)]
+        generator = ([*t, kwargs] for t in tasks)
         sub_sols = []
         if method == self.METHOD_SEQ:
             sub_sols = list(iter.starmap(self._solve_sub_prob, generator))
             sol.finalize(**kwargs)
         elif method == self.METHOD_MUL:
-            with mp.Pool(processes=n_proc) as p:
-                sub_sols = list(p.starmap(self._solve_sub_prob, generator))
+            # Send the sub-problems in a few chunks per process and collect the
+            # solutions as soon as they are available. The arguments common to all
+            # the sub-problems are sent only once to each worker.
+            chunksize = max(1, len(sub_probs) // (n_proc * 4))
+            with _get_mp_context().Pool(
+                processes=n_proc, initializer=_init_worker, initargs=(kwargs,)
+            ) as p:
+                sub_sols = list(
+                    p.imap_unordered(
+                        partial(_call_worker, self._solve_sub_prob),
+                        tasks,
+                        chunksize=chunksize,
+                    )
+                )
             sol.finalize(**kwargs)
         else:
+            logger.info("Generating python files.")
             sub_sols = list(iter.starmap(self._gen_py_file, generator))
         return sub_sols
 
@@ -255,3 +274,38 @@ class ProbParamABC(ProbABC):
         shamo.core.solutions.parametric.SolParamABC
             The generated solution.
         """
+
+
+def _get_mp_context():
+    """Return the `fork` context on Linux to inherit the loaded modules.
+
+    Other platforms keep their default context since forking is not safe on macOS.
+    """
+    if sys.platform.startswith("linux"):
+        return mp.get_context("fork")
+    return mp.get_context()
+
+
+# The arguments shared by all the sub-problems solved by a worker process
+_worker_kwargs = {}
+
+
+def _init_worker(kwargs):
+    """Store the arguments shared by all the sub-problems in a worker process."""
+    global _worker_kwargs
+    _worker_kwargs = kwargs
+
+
+def _call_worker(func, args):
+    """Call `func` with unpacked `args` and the arguments shared by the worker."""
+    return func(*args, _worker_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_template(name):
+    """Return a template from `shamo/templates/py`.
+
+    The template is only loaded and compiled once.
+    """
+    env = Environment(loader=PackageLoader("shamo", "templates/py"))
+    return env.get_template(name)
@@ -96,9 +96,10 @@ class CompGridSampler(CompABC):
             If set to ``True``, the affine matrix is rescaled from meters to
             millimeters. (the default is ``False``)
         """
-        self["affine"] = np.vstack((affine[:3, :], np.array([0, 0, 0, 1])))
+        affine = affine[:3, :]
         if resize:
-            self["affine"] = np.diag([1e-3] * 3 + [1]) @ self["affine"]
+            affine = 1e-3 * affine
+        self["affine"] = np.vstack((affine, [0, 0, 0, 1]))
         self["shape"] = shape
         self["mask"] = mask
 
@@ -145,16 +146,23 @@ class CompGridSampler(CompABC):
         dict [str, str]
             The parameters required to render python template.
         """
-        if self.use_grid:
-            return {
+        if not self.use_grid:
+            return None
+        # The grid is shared by all the sub-problems of a parametric problem so it is
+        # only converted again if one of its values is replaced
+        values = (self.affine, self.shape, self.mask)
+        cached = getattr(self, "_py_param", None)
+        if cached is None or any(v is not c for v, c in zip(values, cached[0])):
+            param = {
                 "affine": str(self.affine.tolist()),
                 "shape": str(self.shape),
                 "mask": str(self.mask.astype(int).tolist())
                 if self.mask is not None
                 else None,
             }
-        else:
-            return None
+            cached = (values, param)
+            self._py_param = cached
+        return cached[1]
 
     def nii_from_pos(self, src, dst):
         """Convert a POS file into a NII file.
@@ -59,11 +59,13 @@ class CompSensors(CompABC):
         sensors = kwargs.get("sensors", {})
         point = []
         real = []
+        real_types = (SensorABC.TYPE_CIRCLE, SensorABC.TYPE_RECT)
         for s in self["sensors"]:
-            if sensors[s].sensor_type == SensorABC.TYPE_POINT:
-                point.append({"sensor": sensors[s].point.group})
-            elif sensors[s].sensor_type in [SensorABC.TYPE_CIRCLE, SensorABC.TYPE_RECT]:
-                real.append({"sensor": sensors[s].surf.group})
+            sensor = sensors[s]
+            if sensor.sensor_type == SensorABC.TYPE_POINT:
+                point.append({"sensor": sensor.point.group})
+            elif sensor.sensor_type in real_types:
+                real.append({"sensor": sensor.surf.group})
         return {"point": point, "real": real}
 
     def to_py_param(self, **kwargs):
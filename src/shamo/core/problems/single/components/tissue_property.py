@@ -62,11 +62,14 @@ class CompTissueProp(CompABC):
         """
         params = []
         tissues = kwargs.get("tissues", {})
-        prop = {name: {t: p[0] for t, p in self.items()}}
+        # Only the formulas of the fields need the values of all the tissues
+        prop = None
         for t, p in self.items():
             if p[1] is None:
                 params.append({"tissue": t, "prop": p[0]})
             else:
+                if prop is None:
+                    prop = {name: {t: p[0] for t, p in self.items()}}
                 params.append(
                     {
                         "tissue": t,
@@ -2,6 +2,7 @@
 import logging
 import re
 from abc import abstractmethod, abstractproperty
+from functools import lru_cache
 from pathlib import Path
 from subprocess import PIPE, STDOUT, CalledProcessError, Popen
 
@@ -87,8 +88,7 @@ class ProbGetDP(ProbABC):
             The path to the temporary problem file.
         """
         logger.info("Generating problem file.")
-        env = Environment(loader=PackageLoader("shamo", "templates/pro"))
-        template = env.get_template(self.template)
+        template = _get_template(self.template)
         content = template.render(**self._prepare_pro_file_params(**kwargs))
         logger.debug(content)
         with open(Path(tmp_dir) / "problem.pro", "w") as f:
@@ -125,3 +125,13 @@ class ProbGetDP(ProbABC):
         exitcode = subprocess_to_logger(process, logger, logging.INFO, LOG_PATTERN)
         if exitcode != 0:
             raise CalledProcessError(exitcode, cmd)
+
+
+@lru_cache(maxsize=None)
+def _get_template(name):
+    """Return a template from `shamo/templates/pro`.
+
+    The template is only loaded and compiled once.
+    """
+    env = Environment(loader=PackageLoader("shamo", "templates/pro"))
+    return env.get_template(name)
@@ -1,5 +1,7 @@
 """Implement `SolParamABC` class."""
 from abc import abstractproperty, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
 import re
 
@@ -65,8 +67,18 @@ class SolParamABC(ObjDir):
         -------
         list [shamo.core.objects.ObjDir]
             The sub-solutions.
+
+        Notes
+        -----
+        The sub-solutions are loaded concurrently by a bounded pool of threads to
+        overlap file accesses.
         """
-        return [self.sub_class.load(p) for p in self.sub_json_paths]
+        paths = self.sub_json_paths
+        if len(paths) < 2:
+            return [self.sub_class.load(p) for p in paths]
+        n_workers = min(len(paths), 32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(self.sub_class.load, paths))
 
     def get_sub_file(self, suffix):
         """Return the relative paths to the same file in all the sub-solutions.
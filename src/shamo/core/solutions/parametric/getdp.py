@@ -32,7 +32,7 @@ class SolParamGetDP(SolParamABC):
         self.update(
             {
                 "sigmas": {
-                    t: [DistABC.load(**p[0]), p[1]]
+                    t: [DistABC.from_dict(p[0]), p[1]]
                     for t, p in kwargs.get("sigmas", {}).items()
                 },
                 "model_json_path": kwargs.get("model_json_path", None),
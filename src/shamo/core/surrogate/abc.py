@@ -33,10 +33,13 @@ class SurrABC(ObjDir):
         super().__init__(name, parent_path)
         self.update(
             {
-                "params": [[n, DistABC.load(**d)] for n, d in kwargs.get("params", [])],
+                "params": [
+                    [n, DistABC.from_dict(d)] for n, d in kwargs.get("params", [])
+                ],
                 "sol_json_path": kwargs.get("sol_json_path", None),
             }
         )
+        self._gp = None
 
     @property
     def gp_path(self):
@@ -166,7 +169,9 @@ class SurrABC(ObjDir):
             ).fit(x, y)
         surr = cls(name, parent_path, params=params)
         surr["sol_json_path"] = str(surr.get_relative_path(sol.json_path))
-        pickle.dump(gp, open(surr.gp_path, "wb"))
+        with open(surr.gp_path, "wb") as f:
+            pickle.dump(gp, f, protocol=pickle.HIGHEST_PROTOCOL)
+        surr._gp = gp
         surr.save()
         return surr
 
@@ -177,8 +182,15 @@ class SurrABC(ObjDir):
         -------
         sklearn.gaussian_process.GaussianProcessRegressor
             The Gaussian process.
+
+        Notes
+        -----
+        The Gaussian process is only unpickled once and then cached.
         """
-        return pickle.load(open(self.gp_path, "rb"))
+        if self._gp is None:
+            with open(self.gp_path, "rb") as f:
+                self._gp = pickle.load(f)
+        return self._gp
 
     def predict(self, x, **kwargs):
         """Evaluate the Gaussian process on new points.
@@ -1,9 +1,10 @@
 """Implement `SolParamEEGLeadfield` class."""
 from shamo.core.solutions.parametric import SolParamGetDP
 from shamo.eeg import SolEEGLeadfield
+from shamo.eeg.leadfield.single.solution import LeadfieldShapeMixin
 
 
-class SolParamEEGLeadfield(SolParamGetDP):
+class SolParamEEGLeadfield(LeadfieldShapeMixin, SolParamGetDP):
     """Store information about an EEG leadfield matrix.
 
     Parameters
@@ -43,48 +44,15 @@ class SolParamEEGLeadfield(SolParamGetDP):
                 "reference": kwargs.get("reference", []),
                 "rois": kwargs.get("rois", []),
                 "sensors": kwargs.get("sensors", []),
-                "shape": tuple(kwargs.get("shape", [])),
                 "use_grid": kwargs.get("use_grid", False),
             }
         )
+        self._set_shape(kwargs.get("shape", []))
 
     @property
     def sub_class(self):
         return SolEEGLeadfield
 
-    @property
-    def shape(self):
-        """Return the shape of the matrix.
-
-        Returns
-        -------
-        tuple [int]
-            The shape of the matrix.
-        """
-        return self["shape"]
-
-    @property
-    def n_sensors(self):
-        """Return the number of active sensors.
-
-        Returns
-        -------
-        int
-            The number of active sensors.
-        """
-        return self["shape"][0]
-
-    @property
-    def n_sources(self):
-        """Return the number of sources.
-
-        Returns
-        -------
-        int
-            The number of sources.
-        """
-        return self["shape"][1]
-
     @property
     def markers(self):
         """Return the names of the markers.
@@ -136,7 +104,7 @@ class SolParamEEGLeadfield(SolParamGetDP):
     def finalize(self, **kwargs):
         """Finalize the solution."""
         self._get_sub_json_paths()
-        sub_sols = self.get_sub_sols()
-        sub_sol = sub_sols[0]
-        self.update({"shape": sub_sol.shape, "sensors": sub_sol.sensors})
+        sub_sol = self.sub_class.load(self.sub_json_paths[0])
+        self._set_shape(sub_sol.shape)
+        self["sensors"] = sub_sol.sensors
         self.save()
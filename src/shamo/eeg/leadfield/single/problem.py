@@ -211,16 +211,22 @@ class ProbEEGLeadfield(ProbGetDP):
         -------
         numpy.ndarray
             The subset of values.
+
+        Raises
+        ------
+        RuntimeError
+            If an element of the subset is not part of the elements.
         """
         if i == 0:
-            mask = np.in1d(elems_tags, source_sp[0], assume_unique=True)
-            idx_tags = np.argsort(elems_tags[mask])
-            idx_sp = np.argsort(source_sp[0])
-            self._tmp_sort_idx = [mask, idx_tags, idx_sp]
-        row = row[self._tmp_sort_idx[0]]
-        new_row = np.zeros((source_sp[0].size, 3))
-        new_row[self._tmp_sort_idx[2]] = row[self._tmp_sort_idx[1]]
-        return new_row
+            sort_idx = np.argsort(elems_tags)
+            pos = np.searchsorted(elems_tags, source_sp[0], sorter=sort_idx)
+            idx = sort_idx[np.minimum(pos, elems_tags.size - 1)]
+            if np.any(elems_tags[idx] != source_sp[0]):
+                raise RuntimeError(
+                    "Some elements of the source space are not in the results."
+                )
+            self._tmp_sort_idx = idx
+        return row[self._tmp_sort_idx]
 
     def _check_components(self, **kwargs):
         """Check if the components are properly set."""
@@ -6,7 +6,58 @@ from shamo.core.problems.single import CompSensors
 from shamo.core.solutions.single import SolGetDP
 
 
-class SolEEGLeadfield(SolGetDP):
+class LeadfieldShapeMixin:
+    """Store the shape of an EEG leadfield matrix and cache its dimensions."""
+
+    @property
+    def shape(self):
+        """Return the shape of the matrix.
+
+        Returns
+        -------
+        tuple [int]
+            The shape of the matrix.
+        """
+        return self["shape"]
+
+    @property
+    def n_sensors(self):
+        """Return the number of active sensors.
+
+        Returns
+        -------
+        int
+            The number of active sensors.
+        """
+        return self._n_sensors
+
+    @property
+    def n_sources(self):
+        """Return the number of sources.
+
+        Returns
+        -------
+        int
+            The number of sources.
+        """
+        return self._n_sources
+
+    def _set_shape(self, shape):
+        """Set the shape of the matrix and cache its dimensions.
+
+        Parameters
+        ----------
+        shape : tuple [int]
+            The shape of the matrix. It is empty as long as the matrix is not set.
+        """
+        self["shape"] = tuple(int(s) for s in shape)
+        if len(self["shape"]) == 2:
+            self._n_sensors, self._n_sources = self["shape"]
+        else:
+            self._n_sensors, self._n_sources = None, None
+
+
+class SolEEGLeadfield(LeadfieldShapeMixin, SolGetDP):
     """Store information about an EEG leadfield matrix.
 
     Parameters
@@ -44,10 +95,10 @@ class SolEEGLeadfield(SolGetDP):
                 "reference": kwargs.get("reference", []),
                 "rois": kwargs.get("rois", []),
                 "sensors": kwargs.get("sensors", []),
-                "shape": tuple(kwargs.get("shape", [])),
                 "use_grid": kwargs.get("use_grid", False),
             }
         )
+        self._set_shape(kwargs.get("shape", []))
 
     @property
     def matrix_path(self):
@@ -60,39 +111,6 @@ class SolEEGLeadfield(SolGetDP):
         """
         return self.path / f"{self.name}.hdf5"
 
-    @property
-    def shape(self):
-        """Return the shape of the matrix.
-
-        Returns
-        -------
-        tuple [int]
-            The shape of the matrix.
-        """
-        return self["shape"]
-
-    @property
-    def n_sensors(self):
-        """Return the number of active sensors.
-
-        Returns
-        -------
-        int
-            The number of active sensors.
-        """
-        return self["shape"][0]
-
-    @property
-    def n_sources(self):
-        """Return the number of sources.
-
-        Returns
-        -------
-        int
-            The number of sources.
-        """
-        return self["shape"][1]
-
     @property
     def markers(self):
         """Return the names of the markers.
@@ -174,7 +192,7 @@ class SolEEGLeadfield(SolGetDP):
                 "e_field", matrix.shape, dtype="f", compression="lzf"
             )
             data[...] = matrix
-        self["shape"] = matrix.shape
+        self._set_shape(matrix.shape)
 
     def get_matrix(self):
         """Return the matrix.
@@ -1,7 +1,7 @@
 """Implement `SolParamHDTDCSSim` class."""
 from shamo.core.solutions.parametric import SolParamGetDP
 from shamo.hd_tdcs import SolHDTDCSSim
-from shamo import DistConstant
+from shamo import DistABC, DistConstant
 
 
 class SolParamHDTDCSSim(SolParamGetDP):
@@ -36,7 +36,7 @@ class SolParamHDTDCSSim(SolParamGetDP):
             {
                 "references": kwargs.get("references", []),
                 "source": kwargs.get("source", []),
-                "current": kwargs.get("current", DistConstant(0.0)),
+                "current": DistABC.from_dict(kwargs.get("current", DistConstant(0.0))),
             }
         )
 
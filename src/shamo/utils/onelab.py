@@ -5,7 +5,6 @@ from pathlib import Path
 
 import nibabel as nib
 import numpy as np
-from scipy.spatial.distance import cdist
 
 import gmsh
 
@@ -130,8 +129,10 @@ def get_elems_subset(dim, tags, min_dist):
     sub_elems_tags = [elems_tags[0]]
     sub_elems_coords = [coords[0]]
     while elems_tags.size > 0:
-        dist = cdist([sub_elems_coords[-1]], coords)[0]
-        idx = dist < min_dist
+        offsets = coords - sub_elems_coords[-1]
+        # Compare the squared distances to avoid the square roots
+        dist = np.einsum("ij,ij->i", offsets, offsets)
+        idx = dist < min_dist * min_dist
         elems_tags = np.delete(elems_tags, idx)
         coords = np.delete(coords, idx, axis=0)
         dist = np.delete(dist, idx)